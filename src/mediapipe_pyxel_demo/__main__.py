@@ -1,41 +1,63 @@
 from __future__ import annotations
 
-import argparse
-from typing import Any, Dict, List, Optional
+import sys
+from typing import Any, Callable, Dict, List, Optional
 
 from . import __version__
-from .app import App
-from .registry import discover_games
 
 
-def _build_provider(spec: str, player_slot: Optional[int] = None, fallback_camera: Optional[int] = None):
-    name, _, param = spec.partition(":")
-    name = name.strip()
-    arg = param.strip()
+def _build_keyboard(arg: str, player_slot: Optional[int], fallback_camera: Optional[int]):
+    from .input_providers.keyboard import KeyboardProvider
 
-    if name == "keyboard":
-        from .input_providers.keyboard import KeyboardProvider
+    return KeyboardProvider()
 
-        return KeyboardProvider()
-    if name == "mediapipe_face":
+
+def _build_face(arg: str, player_slot: Optional[int], fallback_camera: Optional[int]):
+    try:
         from .input_providers.mediapipe_face import FaceProvider
+    except ImportError as exc:
+        raise SystemExit(f"mediapipe_face provider is unavailable: {exc}") from exc
+
+    camera_index: int
+    if arg:
+        try:
+            camera_index = int(arg)
+        except ValueError as exc:
+            raise SystemExit(f"Invalid camera index '{arg}' for mediapipe_face provider") from exc
+    elif fallback_camera is not None:
+        camera_index = int(fallback_camera)
+    else:
+        camera_index = 0
+    player_index = (player_slot + 1) if player_slot is not None else None
+    return FaceProvider(camera_index=camera_index, player_index=player_index)
 
-        camera_index: int
-        if arg:
-            try:
-                camera_index = int(arg)
-            except ValueError as exc:
-                raise SystemExit(f"Invalid camera index '{arg}' for mediapipe_face provider") from exc
-        elif fallback_camera is not None:
-            camera_index = int(fallback_camera)
-        else:
-            camera_index = 0
-        player_index = (player_slot + 1) if player_slot is not None else None
-        return FaceProvider(camera_index=camera_index, player_index=player_index)
-    raise SystemExit(f"Unknown provider: {name}")
+
+# プロバイダ名 -> 生成関数
+_PROVIDERS: Dict[str, Callable[[str, Optional[int], Optional[int]], Any]] = {
+    "keyboard": _build_keyboard,
+    "mediapipe_face": _build_face,
+}
+
+
+def _build_provider(spec: str, player_slot: Optional[int] = None, fallback_camera: Optional[int] = None):
+    name, _, param = spec.partition(":")
+    name = name.strip()
+    builder = _PROVIDERS.get(name)
+    if builder is None:
+        raise SystemExit(f"Unknown provider: {name}")
+    return builder(param.strip(), player_slot, fallback_camera)
 
 
 def main(argv: list[str] | None = None) -> None:
+    if argv is None:
+        argv = sys.argv[1:]
+    # --version は argparse を構築せずに即座に返す
+    if "--version" in argv:
+        print(__version__)
+        return
+
+    import argparse
+
     parser = argparse.ArgumentParser(description="MediaPipe × Pyxel Demo")
     # デフォルトでメニュー（ゲーム選択画面）を起動する
     parser.add_argument("--game", default="menu", help="Game name (discovered)")
@@ -61,15 +83,24 @@ def main(argv: list[str] | None = None) -> None:
         print(__version__)
         return
 
-    games = discover_games()
     if args.list:
-        if not games:
+        # ゲームモジュールはインポートせず、名前だけを列挙する
+        from .registry import list_game_names
+
+        names = list_game_names()
+        if not names:
             print("No games found.")
             return
-        for name, info in games.items():
-            print(f"- {name} ({info.source})")
+        for name, source in names:
+            print(f"- {name} ({source})")
         return
 
+    # pyxel やゲームモジュールの読み込みは実際に起動する場合のみ行う
+    from .app import App
+    from .registry import discover_games
+
+    games = discover_games()
+
     if args.game not in games:
         # 存在しないゲーム名が指定された場合は、利用可能な一覧を表示
         available = ", ".join(sorted(games.keys())) or "<none>"
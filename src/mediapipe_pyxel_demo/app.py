@@ -1,12 +1,18 @@
 from __future__ import annotations
 
-import queue
-from queue import Queue
-import sys
-import traceback
-from typing import Any, List, Optional
+import logging
+import os
+from typing import Any, List, Optional, Set, Tuple
 
-from .events import Action, InputEvent
+from .events import SOURCE_KEYBOARD, Action, EventBuffer
+
+logger = logging.getLogger(__name__)
+
+# 1フレームで処理する入力イベントの上限（溢れた場合は古いものから捨てる）
+EVENT_BUFFER_SIZE = 32
+
+# 環境変数 MEDIAPIPE_PYXEL_DEBUG が設定されている時だけフレーム内エラーのスタックトレースを出す
+_DEBUG = bool(os.environ.get("MEDIAPIPE_PYXEL_DEBUG"))
 
 
 class App:
@@ -14,10 +20,15 @@ class App:
         self.game = game
         self.providers = providers
         self.scale = scale
-        self.events: "Queue[InputEvent]" = Queue()
+        self.events = EventBuffer(maxlen=EVENT_BUFFER_SIZE)
         self._px = None  # Pyxel モジュール（遅延読み込み）
         self._should_quit = False
         self._menu_cls = None
+        # _is_menu_game の判定結果（ゲームが切り替わった時だけ再計算）
+        self._menu_flag_cache_id: Optional[int] = None
+        self._menu_flag = False
+        # 一度ログに出したゲーム側エラー（処理名, 例外型）
+        self._logged_errors: Set[Tuple[str, type]] = set()
 
     # --- ライフサイクル ---
 
@@ -27,11 +38,11 @@ class App:
         self._px = pyxel
         # スレッド型プロバイダを起動
         for p in self.providers:
-            if hasattr(p, "start"):
+            if getattr(p, "start", None) is not None:
                 try:
                     p.start(self.events)
-                except Exception:
-                    traceback.print_exc(file=sys.stderr)
+                except Exception as exc:
+                    logger.warning("provider %s start failed: %r", type(p).__name__, exc, exc_info=True)
 
         try:
             pyxel.init(
@@ -52,13 +63,14 @@ class App:
         assert self._px is not None
         # 1フレーム毎に Pyxel へアクセスが必要なプロバイダをポーリング
         for p in self.providers:
-            if hasattr(p, "poll"):
+            poll = p.poll
+            if poll is not None:
                 try:
-                    p.poll(self._px, self.events)
-                except Exception:
-                    # ログが毎フレーム大量に出ないよう、各プロバイダにつき一度だけ詳細を出力
+                    poll(self._px, self.events)
+                except Exception as exc:
+                    # ログが毎フレーム大量に出ないよう、各プロバイダにつき一度だけ出力
                     if not getattr(p, "_error_logged", False):
-                        traceback.print_exc(file=sys.stderr)
+                        logger.warning("provider %s poll failed: %r", type(p).__name__, exc, exc_info=_DEBUG)
                         try:
                             setattr(p, "_error_logged", True)
                         except Exception:
@@ -66,23 +78,20 @@ class App:
 
         menu_active = self._is_menu_game()
 
-        # 入力イベントキューを空にしつつゲームへ転送
-        while True:
-            try:
-                e = self.events.get_nowait()
-            except queue.Empty:
-                break
-            if menu_active and getattr(e, "note", None) != "keyboard":
+        # 入力イベントをまとめて取り出してゲームへ転送
+        for e in self.events.drain():
+            # メニュー画面ではキーボード入力のみ受け付ける
+            if menu_active and e.source != SOURCE_KEYBOARD:
                 continue
             if e.action == Action.QUIT:
                 # ゲームに先に渡して、ゲーム側で処理するか判断させる
                 try:
                     self.game.on_event(e)
-                except Exception:
-                    pass
+                except Exception as exc:
+                    self._log_game_error("on_event", exc)
                 # ゲームが next_game を設定しなかった場合のみ終了フラグを立てる
                 try:
-                    next_game = getattr(self.game, "next_game", None)
+                    next_game = self.game.next_game
                 except Exception:
                     next_game = None
                 if next_game is None:
@@ -90,19 +99,19 @@ class App:
             else:
                 try:
                     self.game.on_event(e)
-                except Exception:
-                    pass
+                except Exception as exc:
+                    self._log_game_error("on_event", exc)
 
         # ゲームロジックの更新
         try:
             self.game.update()
-        except Exception:
-            pass
+        except Exception as exc:
+            self._log_game_error("update", exc)
 
         # ゲーム側からのゲーム切り替え要求に対応
         # （メニューから選択されたゲームへ切り替え）
         try:
-            next_game = getattr(self.game, "next_game", None)
+            next_game = self.game.next_game
         except Exception:
             next_game = None
         if next_game is not None:
@@ -119,13 +128,25 @@ class App:
         assert self._px is not None
         try:
             self.game.draw(self._px)
-        except Exception:
+        except Exception as exc:
             # 描画で例外が起きても画面をクリアして安全に継続
+            self._log_game_error("draw", exc)
             self._px.cls(0)
 
+    def _log_game_error(self, stage: str, exc: Exception) -> None:
+        # 同じ処理・同じ例外型のエラーは一度だけ出力する
+        key = (stage, type(exc))
+        if key in self._logged_errors:
+            return
+        self._logged_errors.add(key)
+        logger.warning("game %s %s failed: %r", type(self.game).__name__, stage, exc, exc_info=_DEBUG)
+
     def _is_menu_game(self) -> bool:
         if self._menu_cls is None:
             from .games.menu.game import MenuGame
 
             self._menu_cls = MenuGame
-        return isinstance(self.game, self._menu_cls)
+        if id(self.game) != self._menu_flag_cache_id:
+            self._menu_flag_cache_id = id(self.game)
+            self._menu_flag = isinstance(self.game, self._menu_cls)
+        return self._menu_flag
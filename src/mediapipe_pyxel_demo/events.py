@@ -1,8 +1,10 @@
 from __future__ import annotations
 
+from collections import deque
 from dataclasses import dataclass, field
 from enum import Enum, auto
-from typing import Optional
+from typing import Deque, Optional
+import threading
 import time
 
 
@@ -14,11 +16,42 @@ class Action(Enum):
     QUIT = auto()      # 終了要求
 
 
-@dataclass
+# 入力イベントの発生元（App 側のフィルタで整数比較できるようにする）
+SOURCE_UNKNOWN = 0
+SOURCE_KEYBOARD = 1
+SOURCE_FACE = 2
+
+
+@dataclass(slots=True)
 class InputEvent:
     # 入力イベント（抽象アクション＋任意の値）
     action: Action
     value: float = 1.0  # 連続量がある場合に使用（しきい値など）
-    timestamp: float = field(default_factory=time.time)  # イベント発生時刻（秒）
+    timestamp: float = field(default_factory=time.monotonic)  # イベント発生時刻（秒、単調増加クロック）
     note: Optional[str] = None  # デバッグ用メモ
+    source: int = SOURCE_UNKNOWN  # 発生元（SOURCE_*）
+
+
+class EventBuffer:
+    """
+    プロバイダから App へ入力イベントを受け渡すスレッドセーフなバッファ。
+
+    `queue.Queue` 互換の `put()` を提供し、App 側は `drain()` で
+    1フレーム分のイベントをロック1回でまとめて取り出す。
+    `maxlen` を指定すると、溢れた時に古いイベントから破棄する。
+    """
+
+    def __init__(self, maxlen: Optional[int] = None) -> None:
+        self._items: Deque[InputEvent] = deque(maxlen=maxlen)
+        self._lock = threading.Lock()
+
+    def put(self, event: InputEvent) -> None:
+        with self._lock:
+            self._items.append(event)
 
+    def drain(self) -> Deque[InputEvent]:
+        # 中身を空の deque と入れ替えて返す（取り出し側はロック外で処理できる）
+        with self._lock:
+            batch = self._items
+            self._items = deque(maxlen=batch.maxlen)
+        return batch
@@ -0,0 +1,28 @@
+from __future__ import annotations
+
+from typing import Any
+
+from ..events import InputEvent
+
+
+class BaseGame:
+    """
+    ゲームの共通基底クラス。
+
+    App は毎フレーム `next_game` を直接参照するため、既定値をクラス属性として持たせる。
+    サブクラスは `on_event(event)`, `update()`, `draw(px)` を実装する。
+    """
+
+    width = 256
+    height = 224
+
+    next_game: Any = None  # 切り替え先のゲーム（App 側が検知して切り替える）
+
+    def on_event(self, event: InputEvent) -> None:
+        pass
+
+    def update(self) -> None:
+        pass
+
+    def draw(self, px) -> None:
+        pass
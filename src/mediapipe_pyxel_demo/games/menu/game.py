@@ -3,12 +3,15 @@ from __future__ import annotations
 from typing import List, Tuple
 import random
 
+import numpy as np
+
 from ...events import Action, InputEvent
+from ..base import BaseGame
 from ...registry import discover_games
 import pyxel
 
 
-class MenuGame:
+class MenuGame(BaseGame):
     """
     ゲーム選択メニュー。
 
@@ -23,6 +26,13 @@ class MenuGame:
     width = 256
     height = 224
 
+    _TITLE = "MediaPipe × Pyxel"
+    _SUBTITLE = "SPACE: next  ENTER: start  ESC: quit"
+    _OUTLINE_OFFSETS = ((-1, 0), (1, 0), (0, -1), (0, 1))
+    _LIST_TOP = 48
+    _ROW_HEIGHT = 12
+    _OVERLAY_COLKEY = 3  # 文字レイヤー画像の透過色（メニュー内で未使用の色）
+
     def __init__(self) -> None:
         # ゲーム一覧を取得（自分自身のメニューは除外）
         games = discover_games()
@@ -35,19 +45,41 @@ class MenuGame:
         # ソートして安定表示
         items.sort(key=lambda x: x[0])
 
-        self.items = items
+        self.items: Tuple[Tuple[str, type, str], ...] = tuple(items)
+        self._n_items = len(items)
+        # 描画位置や文字列は不変なので一度だけ計算しておく
+        self._title_x = self.width // 2 - len(self._TITLE) * 2
+        self._sub_x = self.width // 2 - len(self._SUBTITLE) * 2
+        self._source_x = self.width - 110
+        self._highlight_w = self.width - 56
+        self._rows = tuple(
+            (self._LIST_TOP + i * self._ROW_HEIGHT, name, f"({source})")
+            for i, (name, _, source) in enumerate(items)
+        )
         self.idx = 0
         self.blink = 0
         self.next_game = None  # App 側が検知してゲーム切り替え
 
         # 背景用の星とスキャンライン
+        # 星は座標 (x, y) と速度を別配列で持ち、更新をまとめて行う
         rnd = random.Random(42)
-        self.stars = [
-            [rnd.randrange(0, self.width), rnd.randrange(0, self.height // 2), 0.1 + rnd.random() * 0.5]
+        stars = [
+            (rnd.randrange(0, self.width), rnd.randrange(0, self.height // 2), 0.1 + rnd.random() * 0.5)
             for _ in range(60)
         ]
+        self._star_xy = np.array([(x, y) for x, y, _ in stars], dtype=np.float32)
+        self._star_sp = np.array([sp for _, _, sp in stars], dtype=np.float32)
+        # y は変化しないので、画面バッファ上の行オフセットを先に求めておく
+        self._star_row = np.array([y * self.width for _, y, _ in stars], dtype=np.int32)
+        # 画面バッファへの NumPy ビュー（取得できない Pyxel では None のまま pset で描く）
+        self._screen_buf = None
+        self._screen_buf_checked = False
         # 効果音の初期化フラグ（Pyxel 初期化後に設定）
         self._sfx_ready = False
+        # 背景グラデーションと固定文字のキャッシュ画像（初回描画時に生成）
+        self._bg_img = None
+        self._overlay_img = None
+        self._bg_ready = False
 
     def _setup_sounds(self) -> None:
         # シンプルなビープ音をサウンドスロット5に設定
@@ -69,12 +101,32 @@ class MenuGame:
             # Pyxel 未初期化や他要因で失敗しても無視（次フレームで再試行）
             self._sfx_ready = False
 
+    def _setup_background(self) -> None:
+        # 変化しない背景と文字（タイトル・説明・項目名）をそれぞれ一度だけ画像に描いておく
+        bg = pyxel.Image(self.width, self.height)
+        self._draw_gradient(bg)
+        overlay = pyxel.Image(self.width, self.height)
+        overlay.cls(self._OVERLAY_COLKEY)
+        self._draw_static_text(overlay)
+        self._bg_img = bg
+        self._overlay_img = overlay
+        self._bg_ready = True
+
+    def _ensure_background(self) -> None:
+        if self._bg_ready:
+            return
+        try:
+            self._setup_background()
+        except Exception:
+            # Pyxel 未初期化などで失敗した場合は次フレームで再試行
+            self._bg_ready = False
+
     # --- 入力 ---
     def on_event(self, e: InputEvent) -> None:
         if not self.items:
             return
         if e.action == Action.ACTION1:
-            self.idx = (self.idx + 1) % len(self.items)
+            self.idx = (self.idx + 1) % self._n_items
             # カーソル移動時の効果音（初回は遅延初期化）
             self._ensure_sounds()
             try:
@@ -94,48 +146,85 @@ class MenuGame:
     # --- 更新 ---
     def update(self) -> None:
         self.blink = (self.blink + 1) % 60
-        for s in self.stars:
-            s[0] -= s[2]
-            if s[0] < -2:
-                s[0] = self.width + 2
+        xs = self._star_xy[:, 0]
+        xs -= self._star_sp
+        xs[xs < -2] = self.width + 2
 
     # --- 描画 ---
     def draw(self, px) -> None:
         # 背景（夜空のグラデーション）
-        for i in range(self.height):
-            col = 1 if i < self.height // 2 else 5
-            px.line(0, i, self.width, i, col)
+        self._ensure_background()
+        if self._bg_ready:
+            px.blt(0, 0, self._bg_img, 0, 0, self.width, self.height)
+        else:
+            self._draw_gradient(px)
 
         # 星
-        for x, y, sp in self.stars:
-            px.pset(int(x), int(y), 7 if (self.blink // 15) % 2 == 0 else 6)
-
-        # タイトル
-        title = "MediaPipe × Pyxel"
-        sub = "SPACE: next  ENTER: start  ESC: quit"
-        tx = self.width // 2 - len(title) * 2
-        # アウトライン
-        for dx, dy in ((-1,0),(1,0),(0,-1),(0,1)):
-            px.text(tx+dx, 12+dy, title, 0)
-        px.text(tx, 12, title, 7)
-        px.text(self.width // 2 - len(sub) * 2, 26, sub, 6)
+        star_col = 7 if (self.blink // 15) % 2 == 0 else 6
+        buf = self._screen_view(px)
+        if buf is not None:
+            # 画面内の星だけをまとめて画面バッファへ書き込む
+            xs = self._star_xy[:, 0].astype(np.int32)
+            visible = (xs >= 0) & (xs < self.width)
+            buf[self._star_row[visible] + xs[visible]] = star_col
+        else:
+            xys = self._star_xy.astype(np.int32).tolist()
+            for x, y in xys:
+                px.pset(x, y, star_col)
+
+        # タイトル・説明・項目名（固定部分）
+        if self._bg_ready:
+            px.blt(0, 0, self._overlay_img, 0, 0, self.width, self.height, self._OVERLAY_COLKEY)
+        else:
+            self._draw_static_text(px)
 
         if not self.items:
-            px.text(20, 60, "No games found.", 8)
             return
 
-        # リスト描画
-        top = 48
-        for i, (name, _, source) in enumerate(self.items):
-            y = top + i * 12
-            color = 11 if i == self.idx else 7
-            px.text(36, y, name, color)
-            px.text(self.width - 110, y, f"({source})", 5)
+        # 選択中の項目だけ色を変えて上書き
+        y, name, _ = self._rows[self.idx]
+        px.text(36, y, name, 11)
 
         # 選択中のハイライト枠
-        if self.items:
-            y = top + self.idx * 12 - 2
-            px.rectb(28, y - 2, self.width - 56, 12, 10)
+        y = self._LIST_TOP + self.idx * self._ROW_HEIGHT - 2
+        px.rectb(28, y - 2, self._highlight_w, 12, 10)
+
+    def _screen_view(self, px):
+        if self._screen_buf_checked:
+            return self._screen_buf
+        self._screen_buf_checked = True
+        try:
+            buf = np.ctypeslib.as_array(px.screen.data_ptr())
+        except Exception:
+            return None
+        # 画面サイズがメニューと一致する場合のみ直接書き込みを使う
+        if buf.dtype == np.uint8 and buf.size == self.width * self.height:
+            self._screen_buf = buf.reshape(-1)
+        return self._screen_buf
+
+    def _draw_gradient(self, target) -> None:
+        for i in range(self.height):
+            col = 1 if i < self.height // 2 else 5
+            target.line(0, i, self.width, i, col)
+
+    def _draw_static_text(self, target) -> None:
+        # target は pyxel モジュール、または pyxel.Image
+        tx = self._title_x
+        # アウトライン
+        for dx, dy in self._OUTLINE_OFFSETS:
+            target.text(tx + dx, 12 + dy, self._TITLE, 0)
+        target.text(tx, 12, self._TITLE, 7)
+        target.text(self._sub_x, 26, self._SUBTITLE, 6)
+
+        if not self.items:
+            target.text(20, 60, "No games found.", 8)
+            return
+
+        # リスト描画（選択色は draw 側で上書き）
+        source_x = self._source_x
+        for y, name, source in self._rows:
+            target.text(36, y, name, 7)
+            target.text(source_x, y, source, 5)
 
 
 # レジストリが `module.GAME_CLASS` を参照するため公開
@@ -1,8 +1,9 @@
 from __future__ import annotations
 from ...events import Action, InputEvent
+from ..base import BaseGame
 from .scenes import SceneManager, TitleScene
 
-class ReactionGame:
+class ReactionGame(BaseGame):
     """
     表情リアクションゲーム:
     - ACTION2（Enter）で驚き顔
@@ -15,14 +16,19 @@ class ReactionGame:
     height = 224
 
     def __init__(self) -> None:
+        self.mgr: SceneManager | None = None
+        self._title_scene: TitleScene | None = None
         self.reset()
 
     # --- game lifecycle ---
     def reset(self) -> None:
         self.next_game = None
         self.score = 0
-        self.mgr = SceneManager()
-        self.mgr.push(TitleScene(self, self.mgr))
+        # SceneManager と TitleScene は作り直さずに使い回す
+        if self.mgr is None or self._title_scene is None:
+            self.mgr = SceneManager()
+            self._title_scene = TitleScene(self, self.mgr)
+        self.mgr.reset(self._title_scene)
 
     def on_event(self, event: InputEvent) -> None:
         if event.action == Action.QUIT:
@@ -37,8 +43,7 @@ class ReactionGame:
         self.next_game = MenuGame()
 
     def update(self):
-        if self.mgr.current:
-            self.mgr.current.update()
+        self.mgr.update()
 
     def draw(self, _px=None):
         if self.mgr.current:
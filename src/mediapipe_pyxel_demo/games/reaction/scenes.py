@@ -1,20 +1,50 @@
 from __future__ import annotations
 
+import functools
+import os
 import random
 import traceback
-from dataclasses import dataclass
-from enum import Enum
+from dataclasses import dataclass, field
+from enum import Enum, IntEnum
 from pathlib import Path
 from typing import Any, Optional, Self
 
+import numpy as np
 import pyxel
 from PyxelUniversalFont import Writer as PythonUniversalFont
+from PyxelUniversalFont import get_pixel_representation
+from PIL import ImageFont
 
 from ...events import Action, InputEvent
 
 
 # --- 設定とアセット管理 --------------------------------
 
+_MASK64 = (1 << 64) - 1
+
+
+def _bounded(n: int) -> int:
+    """0 以上 n 未満の整数を一様に返します（Lemire の乗算による範囲変換）。"""
+    m = random.getrandbits(64) * n
+    low = m & _MASK64
+    if low < n:
+        # 偏りが出る端数領域に入った場合だけ引き直す
+        threshold = ((1 << 64) - n) % n
+        while low < threshold:
+            m = random.getrandbits(64) * n
+            low = m & _MASK64
+    return m >> 64
+
+
+class Phase(IntEnum):
+    # PlayScene の進行段階（値の順に進む）
+    LINE1 = 0    # 1行目の台詞を表示中
+    LINE2 = 1    # 2行目を表示し、反応の受付を開始
+    PROMPT = 2   # 「Reaction Now!」と残り時間ゲージを表示中
+    TIME_UP = 3  # 受付終了後の「Time Up!」表示
+    RESULT = 4   # 判定結果の表示
+
+
 class ReactionType(Enum):
     NONE = 0
     SURPRISE = 1  # 口を開けて驚く表情
@@ -23,13 +53,11 @@ class ReactionType(Enum):
     # 整数値（0/1/2）から列挙値に変換
     @classmethod
     def from_value(cls, value: int) -> Self:
-        for item in cls:
-            if item.value == value:
-                return item
-        return cls.NONE
+        # Enum が持つ値→メンバーの辞書を直接引く
+        return cls._value2member_map_.get(value, cls.NONE)
 
 
-@dataclass(frozen=True)
+@dataclass(frozen=True, slots=True)
 class GameConfig:
     title_text: str = "Speed React"
     title_prompt: str = "Smile to start!"
@@ -46,8 +74,19 @@ class GameConfig:
     scene_dialogue_height: int = 80     # セリフ欄の高さ
     reaction_gauge_height: int = 3      # 残り時間ゲージの高さ
     reaction_gauge_margin: int = 6      # 残り時間ゲージの余白
+    # 以下は上の値から求める派生値（PlayScene の開始からのフレーム数）
+    prompt_start_frame: int = field(init=False)   # プロンプト/ゲージを表示するフレーム
+    reaction_end_frame: int = field(init=False)   # 反応の受付を締め切るフレーム
+
+    def __post_init__(self) -> None:
+        # 2行目を表示したフレームを反応時間の1フレーム目として数える
+        line2_frame = self.line2_delay - 1
+        object.__setattr__(self, "prompt_start_frame", line2_frame + self.reaction_prompt_delay)
+        object.__setattr__(self, "reaction_end_frame", line2_frame + self.reaction_window)
 
 CONFIG = GameConfig()
+# カウントダウンで表示する数字の文字列
+_COUNTDOWN_STRS = tuple(str(v) for v in CONFIG.countdown_values)
 
 
 class ReactionAsset:
@@ -65,105 +104,196 @@ class ReactionAsset:
         self.answers = self._load_answers(self.base_dir / "answers.txt")
         max_count = max(len(self.lines1), len(self.lines2), len(self.answers), 0)
         self.max_qst_id = max_count if max_count > 0 else CONFIG.total_rounds
+        # 出題候補のID列（pick_questions が先頭部分を並べ替えて使い回す）
+        self._pool = list(range(1, self.max_qst_id + 1))
+        # 問題ID順に台詞と正解を並べておき、参照をインデックス1回で済ませる
+        # （ファイルに無い分はプレースホルダーで埋める）
+        ids = range(self.max_qst_id)
+        self._line1 = tuple(
+            self.lines1[i] if i < len(self.lines1) else f"Line 1 for scene {i + 1}" for i in ids
+        )
+        self._line2 = tuple(
+            self.lines2[i] if i < len(self.lines2) else f"Line 2 for scene {i + 1}" for i in ids
+        )
+        self._answer = tuple(
+            self.answers[i] if i < len(self.answers) else ReactionType.NONE for i in ids
+        )
+        # 各ディレクトリの scene_<id>.<拡張子> を一度だけ列挙しておく
+        self._images_1 = self._scan_images(self.image1_dir)
+        self._images_2 = self._scan_images(self.image2_dir)
+        # 問題IDごとの画像パス（1行目用, 2行目用）
+        self._image_paths = tuple(
+            (self._find_image_path(i + 1, 1), self._find_image_path(i + 1, 2)) for i in ids
+        )
+
+    def _load_lines(self, path: Path) -> tuple[str, ...]:
+        try:
+            return tuple(path.read_text(encoding="utf-8").splitlines())
+        except FileNotFoundError:
+            return ()
 
-    def _load_lines(self, path: Path) -> list[str]:
+    def _load_answers(self, path: Path) -> tuple[ReactionType, ...]:
         try:
-            return path.read_text(encoding="utf-8").splitlines()
+            tokens = path.read_text(encoding="utf-8").split()
         except FileNotFoundError:
-            return []
-
-    def _load_answers(self, path: Path) -> list[ReactionType]:
-        answers: list[ReactionType] = []
-        lines = self._load_lines(path)
-        for ln in lines:
-            s = ln.strip()
-            if not s:
-                continue
-            try:
-                answers.append(ReactionType.from_value(int(s)))
-            except ValueError:
-                answers.append(ReactionType.NONE)
-        return answers
+            return ()
+        # 数字以外のトークンは NONE として扱う
+        return tuple(
+            ReactionType.from_value(int(t)) if t.isdigit() else ReactionType.NONE for t in tokens
+        )
 
     # 利用可能なIDから問題をランダムに選びます。足りない場合は重複を許して補充します。
+    # 先頭 total 個だけを Fisher–Yates で確定させるので、候補数ではなく出題数に比例した手間で済みます。
+    # （候補列はどの並び順からでも一様に選べるため、呼び出し後に元の順序へ戻す必要はありません）
     def pick_questions(self, total: int) -> list[int]:
-        pool = list(range(1, self.max_qst_id + 1))
-        if not pool:
-            pool = list(range(1, total + 1))
-        if len(pool) >= total:
-            return random.sample(pool, total)
-        random.shuffle(pool)
-        result = pool[:]
-        while len(result) < total:
-            take = min(len(pool), total - len(result))
-            result.extend(random.sample(pool, take))
-        return result[:total]
+        pool = self._pool
+        n = len(pool)
+        k = min(total, n)
+        for i in range(k):
+            j = i + _bounded(n - i)
+            pool[i], pool[j] = pool[j], pool[i]
+        result = pool[:k]
+        if k < total and n > 0:
+            result.extend(pool[_bounded(n)] for _ in range(total - k))
+        return result
 
     def line1(self, qst_id: int) -> str:
-        idx = qst_id - 1
-        if 0 <= idx < len(self.lines1):
-            return self.lines1[idx]
+        if 0 < qst_id <= self.max_qst_id:
+            return self._line1[qst_id - 1]
         return f"Line 1 for scene {qst_id}"
 
     def line2(self, qst_id: int) -> str:
-        idx = qst_id - 1
-        if 0 <= idx < len(self.lines2):
-            return self.lines2[idx]
+        if 0 < qst_id <= self.max_qst_id:
+            return self._line2[qst_id - 1]
         return f"Line 2 for scene {qst_id}"
 
     def answer(self, qst_id: int) -> ReactionType:
-        idx = qst_id - 1
-        if 0 <= idx < len(self.answers):
-            return self.answers[idx]
+        if 0 < qst_id <= self.max_qst_id:
+            return self._answer[qst_id - 1]
         return ReactionType.NONE
 
-    def image_path(self, qst_id: int, phase: int = 1) -> Optional[Path]:
-        dirs = [self.image2_dir, self.image1_dir] if phase == 2 else [self.image1_dir]
-        for d in dirs:
-            path = self._resolve_image_path(d, qst_id)
-            if path:
-                return path
-        return dirs[0] / f"scene_{qst_id}.jpeg"
-
-    def _resolve_image_path(self, dir: Path, qst_id: int) -> Optional[Path]:
-        fname = f"scene_{qst_id}"
-        exts = (".png", ".jpg", ".jpeg")
-        for e in exts:
-            path = dir / f"{fname}{e}"
-            if path.exists():
-                return path
-        return None
+    def preload_images(self, qst_ids: list[int]) -> None:
+        for qst_id in qst_ids:
+            for phase in (1, 2):
+                try:
+                    load_scene_image(self.image_path(qst_id, phase))
+                except Exception:
+                    # 無い・読めない画像はラウンド開始時にプレースホルダーへフォールバックする
+                    pass
+
+    def image_path(self, qst_id: int, phase: int = 1) -> str:
+        if 0 < qst_id <= self.max_qst_id:
+            return self._image_paths[qst_id - 1][1 if phase == 2 else 0]
+        return self._find_image_path(qst_id, phase)
+
+    def _find_image_path(self, qst_id: int, phase: int) -> str:
+        # 2行目は images_2 を優先し、無ければ images_1 の画像を使う
+        found = self._images_2.get(qst_id) if phase == 2 else None
+        if found is None:
+            found = self._images_1.get(qst_id)
+        if found is not None:
+            return str(found)
+        base = self.image2_dir if phase == 2 else self.image1_dir
+        return str(base / f"scene_{qst_id}.jpeg")
+
+    _IMAGE_EXTS = (".png", ".jpg", ".jpeg")  # 同じIDの画像が複数ある場合は前にあるものを優先
+
+    def _scan_images(self, dir: Path) -> dict[int, Path]:
+        found: dict[int, tuple[int, Path]] = {}
+        try:
+            entries = list(os.scandir(dir))
+        except OSError:
+            return {}
+        for entry in entries:
+            stem, ext = os.path.splitext(entry.name)
+            if ext not in self._IMAGE_EXTS or not stem.startswith("scene_"):
+                continue
+            qst_id = stem[len("scene_"):]
+            if not qst_id.isdigit() or str(int(qst_id)) != qst_id or not entry.is_file():
+                continue
+            rank = self._IMAGE_EXTS.index(ext)
+            key = int(qst_id)
+            if key not in found or rank < found[key][0]:
+                found[key] = (rank, Path(entry.path))
+        return {key: path for key, (_, path) in found.items()}
+
+# アセットの読み込みはプロセス内で一度だけ行い、リスタート時も同じインスタンスを共有する
+@functools.lru_cache(maxsize=1)
+def get_reaction_asset() -> ReactionAsset:
+    return ReactionAsset()
+
+ASSET = get_reaction_asset()
 
-ASSET = ReactionAsset()
+
+# デコード済みのシーン画像をパスごとに保持する（セッション開始時にまとめて読み込み、ラウンド中は参照のみ）
+@functools.lru_cache(maxsize=max(16, 2 * CONFIG.total_rounds))  # 1問につき最大2枚
+def load_scene_image(path: str) -> pyxel.Image:
+    return pyxel.Image.from_image(path)
+
+
+def _copy_sound(src: pyxel.Sound) -> pyxel.Sound:
+    snd = pyxel.Sound()
+    snd.notes[:] = list(src.notes)
+    snd.tones[:] = list(src.tones)
+    snd.volumes[:] = list(src.volumes)
+    snd.effects[:] = list(src.effects)
+    snd.speed = src.speed
+    return snd
 
 
 class ReactionSoundPlayer:
 
     def __init__(self, base_dir: Path) -> None:
         self.base_dir = base_dir
+        # 存在するサウンドファイル名（拡張子なし）。再生のたびにファイルを確認しないよう起動時に一度だけ調べる
+        self._available = self._scan_sounds(base_dir)
+        # 名前 -> 読み込み済みの Sound（pyxel.init 後の初回再生時にまとめて作る）
+        self._sounds: Optional[dict[str, pyxel.Sound]] = None
 
     def play(self, event: str, qst_id: Optional[int] = None) -> bool:
-        path = self._find_sound_path(event, qst_id)
-        if not path:
+        sound = self._find_sound(event, qst_id)
+        if sound is None:
             return False
         try:
-            pyxel.load(str(path),exclude_images=True)
-            pyxel.play(0, 0)
+            pyxel.play(0, sound)
         except Exception as e:
-            print(f"[ReactionSoundPlayer] Sound load error for '{path}': {e}")
+            print(f"[ReactionSoundPlayer] Sound play error for '{event}': {e}")
             traceback.print_exc()
             return False
+        return True
 
-    def _find_sound_path(self, event: str, qst_id: Optional[int]) -> Optional[Path]:
-        names: list[str] = []
+    @staticmethod
+    def _scan_sounds(dir: Path) -> frozenset[str]:
+        try:
+            entries = list(os.scandir(dir))
+        except OSError:
+            return frozenset()
+        return frozenset(
+            stem for stem, ext in (os.path.splitext(e.name) for e in entries) if ext == ".pyxres"
+        )
+
+    def _load_sounds(self) -> dict[str, pyxel.Sound]:
+        # 各 .pyxres は一度だけ読み込み、0番のサウンドを独立した Sound に写しておく
+        sounds: dict[str, pyxel.Sound] = {}
+        for name in sorted(self._available):
+            path = self.base_dir / f"{name}.pyxres"
+            try:
+                pyxel.load(str(path), exclude_images=True, exclude_tilemaps=True, exclude_musics=True)
+                sounds[name] = _copy_sound(pyxel.sounds[0])
+            except Exception as e:
+                print(f"[ReactionSoundPlayer] Sound load error for '{path}': {e}")
+                traceback.print_exc()
+        return sounds
+
+    def _find_sound(self, event: str, qst_id: Optional[int]) -> Optional[pyxel.Sound]:
+        sounds = self._sounds
+        if sounds is None:
+            sounds = self._sounds = self._load_sounds()
         if qst_id is not None:
-            names.append(f"scene_{qst_id}_{event}")
-        names.append(event)
-        for n in names:
-            path = self.base_dir / f"{n}.pyxres"
-            if path.exists():
-                return path
-        return None
+            sound = sounds.get(f"scene_{qst_id}_{event}")
+            if sound is not None:
+                return sound
+        return sounds.get(event)
 
 SOUND_PLAYER = ReactionSoundPlayer(ASSET.sound_dir)
 
@@ -172,7 +302,7 @@ SOUND_PLAYER = ReactionSoundPlayer(ASSET.sound_dir)
 # 画面をクラス（Scene）として分け、SceneManagerでスタック管理（push/pop/replace）と出題セッションを制御します。
 
 
-@dataclass
+@dataclass(slots=True)
 class ReactionSession:
     questions: list[int]
     index: int = 0
@@ -191,6 +321,7 @@ class ReactionSession:
 
 
 class Scene:
+    __slots__ = ("app", "mgr")
 
     def __init__(self, app, manager):
         self.app = app
@@ -202,6 +333,10 @@ class Scene:
     def on_exit(self) -> None:
         pass
 
+    # 使い回すシーンの状態を初期化する（SceneManager.reset から呼ばれる）
+    def reset(self) -> None:
+        pass
+
     def on_event(self, event: InputEvent) -> None:
         pass
 
@@ -213,10 +348,16 @@ class Scene:
 
 
 class SceneManager:
+    __slots__ = ("stack", "session", "tick", "blink_on", "_blink_left")
 
     def __init__(self):
         self.stack: list[Scene] = []
         self.session: Optional[ReactionSession] = None
+        # update のたびに1増える経過フレーム数。シーンの時間計測はすべてこれを使う
+        self.tick = 0
+        # プロンプト点滅の表示状態（prompt_blink フレームごとに切り替える）
+        self.blink_on = True
+        self._blink_left = CONFIG.prompt_blink
 
     @property
     def current(self) -> Optional[Scene]:
@@ -235,12 +376,31 @@ class SceneManager:
         self.pop()
         self.push(scene)
 
+    # スタックとセッションをその場で空にし、root シーンから再開する
+    def reset(self, root: Scene) -> None:
+        while self.stack:
+            self.pop()
+        self.session = None
+        root.reset()
+        self.push(root)
+
     def handle_event(self, event: InputEvent) -> None:
         if self.current:
             self.current.on_event(event)
 
+    def update(self) -> None:
+        self.tick += 1
+        self._blink_left -= 1
+        if self._blink_left == 0:
+            self._blink_left = CONFIG.prompt_blink
+            self.blink_on = not self.blink_on
+        if self.current:
+            self.current.update()
+
     def start_session(self, questions: list[int]) -> None:
         self.session = ReactionSession(questions=questions)
+        # ラウンド中に画像のデコードが起きないよう、出題分をまとめて読み込んでおく
+        ASSET.preload_images(questions)
 
     def current_qst_id(self) -> Optional[int]:
         if self.session:
@@ -258,36 +418,79 @@ FONT_NAME = "IPA_Gothic.ttf"
 FONT_BASE_SIZE = 16
 FONT_WRITER = PythonUniversalFont(FONT_NAME)
 
+# 文字を描く位置と色の組 (dx, dy, color)。color が None の場合は指定色で描く
+_PLAIN_PASSES = ((0, 0, None),)
+_OUTLINE_PASSES = ((-1, 0, 0), (1, 0, 0), (0, -1, 0), (0, 1, 0)) + _PLAIN_PASSES
+
+
+@functools.lru_cache(maxsize=8)
+def _font(font_size: int) -> ImageFont.FreeTypeFont:
+    return ImageFont.truetype(FONT_WRITER.font_path, font_size)
+
 
+# フォントの送り幅から実際の表示幅を求める（半角文字は全角の半分の幅になる）
+@functools.lru_cache(maxsize=512)
 def measure_text_width(text: str, scale: int = 1) -> int:
     if not text:
         return 0
     font_size = FONT_BASE_SIZE * max(1, scale)
-    return font_size * len(text)
+    try:
+        return round(_font(font_size).getlength(text))
+    except OSError:
+        return font_size * len(text)
+
+
+@functools.lru_cache(maxsize=128)
+def _text_image(text: str, font_size: int, color: int, outline: bool) -> Optional[tuple[pyxel.Image, int]]:
+    # 文字列を一度だけラスタライズし、縁取りも重ねた1枚の画像と透過色を返す
+    glyphs = get_pixel_representation(
+        text=text,
+        font_path=FONT_WRITER.font_path,
+        font_size=font_size,
+        font_color=1,
+        background_color=0,
+    )
+    if glyphs is None:
+        return None
+    passes = _OUTLINE_PASSES if outline else _PLAIN_PASSES
+    pad = 1 if outline else 0
+    used = {color if c is None else c for _, _, c in passes}
+    colkey = next(c for c in range(16) if c not in used)
+
+    mask = glyphs == 1
+    h, w = mask.shape
+    canvas = np.full((h + pad * 2, w + pad * 2), colkey, dtype=np.uint8)
+    for ox, oy, c in passes:
+        region = canvas[pad + oy : pad + oy + h, pad + ox : pad + ox + w]
+        region[mask] = color if c is None else c
+
+    img = pyxel.Image(canvas.shape[1], canvas.shape[0])
+    try:
+        np.ctypeslib.as_array(img.data_ptr())[:] = canvas.ravel()
+    except Exception:
+        # 画像バッファを直接扱えない場合は1画素ずつ書き込む
+        for py, row in enumerate(canvas.tolist()):
+            for px, c in enumerate(row):
+                img.pset(px, py, c)
+    return img, colkey
 
 
 def draw_text(text: str, x: int, y: int, color: int, scale: int = 1, outline: bool = False) -> None:
     if not text:
         return
     font_size = FONT_BASE_SIZE * max(1, scale)
-    if outline:
-        for ox, oy in ((-1, 0), (1, 0), (0, -1), (0, 1)):
-            FONT_WRITER.draw(
-                x + ox,
-                y + oy,
-                text,
-                font_size=font_size,
-                font_color=0,
-                background_color=-1,
-            )
-    FONT_WRITER.draw(
-        x,
-        y,
-        text,
-        font_size=font_size,
-        font_color=color,
-        background_color=-1,
-    )
+    cached = _text_image(text, font_size, color, outline)
+    if cached is None:
+        return
+    img, colkey = cached
+    pad = 1 if outline else 0
+    pyxel.blt(x - pad, y - pad, img, 0, 0, img.width, img.height, colkey)
+
+
+@functools.lru_cache(maxsize=128)
+def _center_x(text: str, scale: int, width: int, offset_x: int) -> int:
+    # 表示する文字列はほぼ固定なので、中央寄せの x 座標を覚えておく
+    return width // 2 - measure_text_width(text, scale) // 2 + offset_x
 
 
 def draw_centered_text(
@@ -299,9 +502,7 @@ def draw_centered_text(
     offset_x: int = 0,
     outline: bool = False
 ) -> None:
-    text_width = measure_text_width(text, scale)
-    x = width // 2 - text_width // 2 + offset_x
-    draw_text(text, x, y, color, scale, outline)
+    draw_text(text, _center_x(text, scale, width, offset_x), y, color, scale, outline)
 
 
 # --- 各シーンの実装 ----------------------------------------------------------------
@@ -309,9 +510,18 @@ def draw_centered_text(
 
 
 class TitleScene(Scene):
+    __slots__ = ("start_requested", "_background")
+
+    _PALETTE = (1, 1, 2, 2, 4, 4, 5, 5)
+
     def __init__(self, app, mgr):
         super().__init__(app, mgr)
         self.start_requested = False
+        # 背景グラデーションの画像（初回描画時に生成）
+        self._background: Optional[pyxel.Image] = None
+
+    def reset(self) -> None:
+        self.start_requested = False
 
     def on_event(self, event: InputEvent) -> None:
         if event.action == Action.ACTION3:
@@ -326,38 +536,49 @@ class TitleScene(Scene):
             SOUND_PLAYER.play("count")
             self.mgr.replace(CountScene(self.app, self.mgr))
 
+    def _render_background(self, w: int, h: int) -> pyxel.Image:
+        # 縦グラデーションは変化しないので、一度だけ画像に描いておく
+        img = pyxel.Image(w, h)
+        n = len(self._PALETTE)
+        # 行 y の色は palette[y * n // h] なので、色ごとの帯を矩形1つで塗る
+        for i, col in enumerate(self._PALETTE):
+            top = -(-i * h // n)
+            bottom = -(-(i + 1) * h // n)
+            if bottom > top:
+                img.rect(0, top, w, bottom - top, col)
+        return img
+
     def draw(self) -> None:
-        pyxel.cls(0)
         w = self.app.width
         h = self.app.height
-        palette = (1, 1, 2, 2, 4, 4, 5, 5)
-        for y in range(h):
-            idx = int(y / h * len(palette))
-            idx = min(idx, len(palette) - 1)
-            pyxel.line(0, y, w, y, palette[idx])
+        if self._background is None:
+            self._background = self._render_background(w, h)
+        pyxel.blt(0, 0, self._background, 0, 0, w, h)
 
-        draw_centered_text(CONFIG.title_text, h // 3 + 1, 0, scale=2, width=w, offset_x=84)
-        draw_centered_text(CONFIG.title_text, h // 3, 7, scale=2, width=w, offset_x=84)
+        draw_centered_text(CONFIG.title_text, h // 3 + 1, 0, scale=2, width=w)
+        draw_centered_text(CONFIG.title_text, h // 3, 7, scale=2, width=w)
 
-        blink_on = (pyxel.frame_count // CONFIG.prompt_blink) % 2 == 0
-        if blink_on:
-            draw_centered_text(CONFIG.title_prompt, h - 40 + 1, 0, width=w, offset_x=58)
-            draw_centered_text(CONFIG.title_prompt, h - 40, 7, width=w, offset_x=58)
+        if self.mgr.blink_on:
+            draw_centered_text(CONFIG.title_prompt, h - 40 + 1, 0, width=w)
+            draw_centered_text(CONFIG.title_prompt, h - 40, 7, width=w)
 
 
 class CountScene(Scene):
+    __slots__ = ("index", "next_switch", "sequence", "_n")
+
     def __init__(self, app, mgr):
         super().__init__(app, mgr)
         self.index = 0
-        self.timer = 0
-        self.sequence = list(CONFIG.countdown_values)
+        # 次に数字を切り替える tick
+        self.next_switch = self.mgr.tick + CONFIG.countdown_interval
+        self.sequence = CONFIG.countdown_values
+        self._n = len(self.sequence)
 
     def update(self) -> None:
-        self.timer += 1
-        if self.timer >= CONFIG.countdown_interval:
-            self.timer = 0
+        if self.mgr.tick >= self.next_switch:
+            self.next_switch += CONFIG.countdown_interval
             self.index += 1
-            if self.index >= len(self.sequence):
+            if self.index >= self._n:
                 qst_id = self.mgr.current_qst_id()
                 if qst_id is None:
                     qst_id = 1
@@ -367,38 +588,64 @@ class CountScene(Scene):
 
     def draw(self) -> None:
         pyxel.cls(0)
-        if self.index < len(self.sequence):
-            current_number = str(self.sequence[self.index])
-            draw_centered_text(current_number, self.app.height // 2 - 30, 7, scale=3, width=self.app.width, offset_x=10)
+        if self.index < self._n:
+            current_number = _COUNTDOWN_STRS[self.index]
+            draw_centered_text(current_number, self.app.height // 2 - 30, 7, scale=3, width=self.app.width)
 
 
 class PlayScene(Scene):
+    __slots__ = (
+        "qst_id", "round_number", "_session_total", "_round_text", "_round_text_x", "_gauge_x",
+        "_gauge_y", "_gauge_w", "_gauge_total", "line1_text", "line2_text", "expected",
+        "start_frame", "_line2_frame", "_result_frame", "_next_frame", "phase",
+        "reaction_registered", "evaluation_is_correct", "_result_message", "_result_color",
+        "scene_loaded", "scene_image", "_image_paths", "current_image_variant",
+        "line2_transition_done", "_handlers",
+    )
 
     def __init__(self, app, mgr, qst_id: int):
         super().__init__(app, mgr)
         self.qst_id = qst_id
         self.round_number = (self.mgr.session.index + 1) if self.mgr.session else 1
+        # ラウンド表示（例: 2/5）はシーン中に変わらないので位置ごと求めておく
+        self._session_total = self.mgr.session.total if self.mgr.session else CONFIG.total_rounds
+        self._round_text = f"{self.round_number}/{self._session_total}"
+        right_margin = 6
+        self._round_text_x = app.width - right_margin - measure_text_width(self._round_text)
+        # 残り時間ゲージの位置と大きさ（セリフ欄の下端に沿って表示）
+        margin = CONFIG.reaction_gauge_margin
+        self._gauge_x = margin
+        self._gauge_y = app.height - CONFIG.reaction_gauge_height - margin
+        self._gauge_w = app.width - margin * 2
+        self._gauge_total = max(1, CONFIG.reaction_window)
         self.line1_text = ASSET.line1(qst_id)
         self.line2_text = ASSET.line2(qst_id)
         self.expected = ASSET.answer(qst_id)
-        self.frames = 0
-        self.reaction_elapsed = 0
-        self.line2_shown = False
-        self.prompt_active = False
-        self.reaction_window_active = False
+        # 経過フレーム数は tick との差で求める（開始フレームの次が1フレーム目）
+        self.start_frame = self.mgr.tick
+        self._line2_frame = 0   # 2行目を表示したフレーム
+        self._result_frame = 0  # 「Time Up!」から結果表示へ移るフレーム
+        self._next_frame = 0    # 結果表示を終えて次へ進むフレーム
+        self.phase = Phase.LINE1
         self.reaction_registered: Optional[ReactionType] = None
-        self.result_ready = False
-        self.result_timer = 0
-        self.time_up_timer = 0
-        self.time_up_phase = False
-        self.score_applied = False
+        self.evaluation_is_correct = False
+        # 結果表示の文言と色（判定時に決まる）
+        self._result_message = "Bad Reaction..."
+        self._result_color = 8
         self.scene_loaded = False
-        self.scene_bank = 1
+        self.scene_image: Optional[pyxel.Image] = None
+        # 1行目・2行目で表示する画像のパス
+        self._image_paths = (ASSET.image_path(qst_id, 1), ASSET.image_path(qst_id, 2))
         self.current_image_variant = 0
         self.line2_transition_done = False
-        self.prompt_sound_played = False
-        self.time_up_sound_played = False
-        self.result_sound_played = False
+        # 段階ごとの更新処理（Phase の値で引く）
+        self._handlers = (
+            self._update_line1,
+            self._update_reaction,
+            self._update_reaction,
+            self._update_time_up,
+            self._update_result,
+        )
 
     def on_enter(self) -> None:
         self.scene_loaded = self._load_scene_image(variant=1)
@@ -407,12 +654,10 @@ class PlayScene(Scene):
         self._play_sound("start")
 
     def _load_scene_image(self, variant: int) -> bool:
-        path = ASSET.image_path(self.qst_id, variant)
-        if not path or not path.exists():
-            return False
         try:
-            pyxel.images[self.scene_bank].load(0, 0, str(path))
+            self.scene_image = load_scene_image(self._image_paths[variant - 1])
         except Exception:
+            # ファイルが無い・読めない場合はプレースホルダー表示のまま
             return False
         self.scene_loaded = True
         self.current_image_variant = variant
@@ -423,15 +668,15 @@ class PlayScene(Scene):
             if SOUND_PLAYER.play(event, self.qst_id):
                 return
 
-    def _handle_line2_shown(self) -> None:
-        self.line2_shown = True
-        self.reaction_window_active = True
-        self.reaction_elapsed = 0
+    def _handle_line2_shown(self, frames: int) -> None:
+        self.phase = Phase.LINE2
+        self._line2_frame = frames
         self.line2_transition_done = self._load_scene_image(variant=2)
         self._play_sound("line2")
 
     def on_event(self, event: InputEvent) -> None:
-        if not self.reaction_window_active:
+        # 反応を受け付けるのは2行目の表示から締め切りまで
+        if self.phase != Phase.LINE2 and self.phase != Phase.PROMPT:
             return
         if event.action == Action.ACTION2:
             if self.reaction_registered != ReactionType.SURPRISE:
@@ -441,61 +686,51 @@ class PlayScene(Scene):
                 self.reaction_registered = ReactionType.SMILE
 
     def update(self) -> None:
-        self.frames += 1
-        if not self.line2_shown and self.frames >= CONFIG.line2_delay:
-            self._handle_line2_shown()
-
-        if self.line2_shown and not self.result_ready:
-            self.reaction_elapsed += 1
-            if (
-                not self.prompt_active
-                and self.reaction_elapsed >= CONFIG.reaction_prompt_delay
-            ):
-                self.prompt_active = True
-                if not self.prompt_sound_played:
-                    self._play_sound("prompt")
-                    self.prompt_sound_played = True
-            if self.reaction_elapsed >= CONFIG.reaction_window:
-                if self.reaction_window_active:
-                    self.reaction_window_active = False
-                if self.prompt_active:
-                    self.prompt_active = False
-                if not self.time_up_phase:
-                    self.time_up_phase = True
-                    self.time_up_timer = 0
-                    if not self.time_up_sound_played:
-                        self._play_sound("line2")
-                        self.time_up_sound_played = True
-
-        if self.time_up_phase and not self.result_ready:
-            self.time_up_timer += 1
-            if self.time_up_timer >= CONFIG.time_up_hold:
-                self.time_up_phase = False
-                self.result_ready = True
-                self._evaluate_reaction()
-
-        if self.result_ready:
-            self.result_timer += 1
-            if self.result_timer >= CONFIG.result_hold:
-                self._proceed_next()
+        self._handlers[self.phase](self.mgr.tick - self.start_frame)
+
+    # 各段階の処理は、次の段階へ進んだフレームでその段階の処理も続けて行う
+    def _update_line1(self, frames: int) -> None:
+        if frames >= CONFIG.line2_delay:
+            self._handle_line2_shown(frames)
+            self._update_reaction(frames)
+
+    def _update_reaction(self, frames: int) -> None:
+        if self.phase == Phase.LINE2 and frames >= CONFIG.prompt_start_frame:
+            self.phase = Phase.PROMPT
+            self._play_sound("prompt")
+        if frames >= CONFIG.reaction_end_frame:
+            self.phase = Phase.TIME_UP
+            self._result_frame = frames + CONFIG.time_up_hold - 1
+            self._play_sound("line2")
+            self._update_time_up(frames)
+
+    def _update_time_up(self, frames: int) -> None:
+        if frames >= self._result_frame:
+            self.phase = Phase.RESULT
+            self._next_frame = frames + CONFIG.result_hold - 1
+            self._evaluate_reaction()
+            self._update_result(frames)
+
+    def _update_result(self, frames: int) -> None:
+        if frames >= self._next_frame:
+            self._proceed_next()
 
     def _evaluate_reaction(self) -> None:
         observed = self.reaction_registered or ReactionType.NONE
         correct = observed == self.expected
-        if correct and not self.score_applied:
+        if correct:
             self.app.score += 1
-            self.score_applied = True
         self.evaluation_is_correct = correct
-        if not self.result_sound_played:
-            if correct:
-                self._play_sound("result_good")
-            else:
-                self._play_sound("result_bad")
-            self.result_sound_played = True
+        if correct:
+            self._result_message, self._result_color = "Good Reaction!", 11
+        else:
+            self._result_message, self._result_color = "Bad Reaction...", 8
+        self._play_sound("result_good" if correct else "result_bad")
 
     def _proceed_next(self) -> None:
         self.mgr.advance_question()
-        if self.mgr.session and self.mgr.session.index < self.mgr.session.total:
+        session = self.mgr.session
+        if session and session.index < self._session_total:
             SOUND_PLAYER.play("count")
             self.mgr.replace(CountScene(self.app, self.mgr))
         else:
@@ -503,58 +738,58 @@ class PlayScene(Scene):
             self.mgr.replace(ScoreScene(self.app, self.mgr))
 
     def draw(self) -> None:
-        pyxel.cls(0)
+        # 毎フレーム参照するグローバルや属性はローカル変数に束縛しておく
+        cfg = CONFIG
+        rect = pyxel.rect
+        text = draw_text
+        phase = self.phase
         w = self.app.width
-        scene_height = self.app.height - CONFIG.scene_dialogue_height
+        dialog_h = cfg.scene_dialogue_height
+        scene_height = self.app.height - dialog_h
+
+        pyxel.cls(0)
         if self.scene_loaded:
-            pyxel.rect(0, 0, w, scene_height, 0)
-            pyxel.blt(0, 0, self.scene_bank, 0, 0, w, scene_height, 0)
+            rect(0, 0, w, scene_height, 0)
+            pyxel.blt(0, 0, self.scene_image, 0, 0, w, scene_height, 0)
         else:
-            pyxel.rect(0, 0, w, scene_height, 1)
+            rect(0, 0, w, scene_height, 1)
             placeholder = f"Scene #{self.qst_id}"
             draw_centered_text(placeholder, scene_height // 2 - 6, 7, width=w)
 
-
         dialog_y = scene_height
-        pyxel.rect(0, dialog_y, w, CONFIG.scene_dialogue_height, 0)
-        draw_text(self.line1_text, 6, dialog_y + 6, 7)
-        round_text = f"{self.round_number}/{self.mgr.session.total if self.mgr.session else CONFIG.total_rounds}"
-        round_text_width = measure_text_width(round_text)
-        right_margin = 6
-        draw_text(round_text, w - right_margin - round_text_width + 20, dialog_y + 6, 7)
-        if self.line2_shown:
-            draw_text(self.line2_text, 6, dialog_y + 30, 7)
+        rect(0, dialog_y, w, dialog_h, 0)
+        text(self.line1_text, 6, dialog_y + 6, 7)
+        text(self._round_text, self._round_text_x, dialog_y + 6, 7)
+        if phase >= Phase.LINE2:
+            text(self.line2_text, 6, dialog_y + 30, 7)
         else:
-            draw_text("..." if self.line2_text else "", 6, dialog_y + 30, 7)
-
-        if self.prompt_active and not self.result_ready:
-            draw_text("Reaction Now!", 6, dialog_y + 54, 8)
-            remaining = max(0, CONFIG.reaction_window - self.reaction_elapsed)
-            total = max(1, CONFIG.reaction_window)
-            ratio = remaining / total
-            margin = CONFIG.reaction_gauge_margin
-            gauge_width = w - margin * 2
-            filled = int(gauge_width * ratio)
-            gauge_y = dialog_y + CONFIG.scene_dialogue_height - CONFIG.reaction_gauge_height - margin
-            pyxel.rect(margin, gauge_y, gauge_width, CONFIG.reaction_gauge_height, 2)
-            pyxel.rect(margin, gauge_y, filled, CONFIG.reaction_gauge_height, 8)
-
-        if self.time_up_phase:
-            draw_centered_text("Time Up!", dialog_y + 54, 10, scale=1, width=w, offset_x=30)
-
-        if self.result_ready:
-            if getattr(self, "evaluation_is_correct", False):
-                color = 11
-                message = "Good Reaction!"
-            else:
-                color = 8
-                message = "Bad Reaction..."
-            draw_centered_text(message, dialog_y + 54, color, scale=1, width=w, offset_x=60)
+            text("..." if self.line2_text else "", 6, dialog_y + 30, 7)
+
+        if phase == Phase.PROMPT:
+            text("Reaction Now!", 6, dialog_y + 54, 8)
+            # 2行目を表示したフレームを1として数えた反応の経過フレーム数
+            elapsed = self.mgr.tick - self.start_frame - self._line2_frame + 1
+            remaining = max(0, cfg.reaction_window - elapsed)
+            filled = int(self._gauge_w * (remaining / self._gauge_total))
+            gauge_h = cfg.reaction_gauge_height
+            rect(self._gauge_x, self._gauge_y, self._gauge_w, gauge_h, 2)
+            rect(self._gauge_x, self._gauge_y, filled, gauge_h, 8)
+
+        if phase == Phase.TIME_UP:
+            draw_centered_text("Time Up!", dialog_y + 54, 10, scale=1, width=w)
+
+        if phase == Phase.RESULT:
+            draw_centered_text(self._result_message, dialog_y + 54, self._result_color, scale=1, width=w)
 
 
 class ScoreScene(Scene):
+    __slots__ = ("_score_text",)
+
     def __init__(self, app, mgr):
         super().__init__(app, mgr)
+        # スコアはこのシーンの間は変わらないので、表示文字列を一度だけ作っておく
+        total = self.mgr.session.total if self.mgr.session else CONFIG.total_rounds
+        self._score_text = f"{self.app.score}/{total}"
 
     def on_event(self, event: InputEvent) -> None:
         if event.action == Action.ACTION3:
@@ -564,10 +799,8 @@ class ScoreScene(Scene):
     def draw(self) -> None:
         pyxel.cls(0)
         w = self.app.width
-        total = self.mgr.session.total if self.mgr.session else CONFIG.total_rounds
-        draw_centered_text("Your reaction score is", 60, 7, width=w, offset_x=85)
-        score_text = f"{self.app.score}/{total}"
-        draw_centered_text(score_text, self.app.height // 2 - 28, 11, scale=3, width=w, offset_x=33)
-        blink_on = (pyxel.frame_count // CONFIG.prompt_blink) % 2 == 0
-        if blink_on:
-            draw_centered_text(CONFIG.restart_prompt, self.app.height - 40, 7, width=w, offset_x=58)
+        h = self.app.height
+        draw_centered_text("Your reaction score is", 60, 7, width=w)
+        draw_centered_text(self._score_text, h // 2 - 28, 11, scale=3, width=w)
+        if self.mgr.blink_on:
+            draw_centered_text(CONFIG.restart_prompt, h - 40, 7, width=w)
@@ -3,6 +3,7 @@ from __future__ import annotations
 from typing import Sequence
 
 from ...events import Action, InputEvent
+from ..base import BaseGame
 from .scenes import SceneManager, TitleScene
 
 
@@ -10,7 +11,7 @@ DEFAULT_CAMERA_INDICES: tuple[int, int] = (0, 1)
 DEFAULT_PLAYER_LABELS: tuple[str, str] = ("Player 1", "Player 2")
 
 
-class ReactionVsGame:
+class ReactionVsGame(BaseGame):
     """2プレイヤー対戦型の表情リアクションゲーム。"""
 
     width = 256
@@ -31,6 +32,7 @@ class ReactionVsGame:
         self.player_labels: tuple[str, ...] = tuple(str(label) for label in labels)
         self.player_scores: list[int] = []
         self.mgr: SceneManager | None = None
+        self._title_scene: TitleScene | None = None
         self.reset()
 
     # --- helper properties -------------------------------------------------
@@ -49,8 +51,11 @@ class ReactionVsGame:
     def reset(self) -> None:
         self.next_game = None
         self.reset_scores()
-        self.mgr = SceneManager()
-        self.mgr.push(TitleScene(self, self.mgr))
+        # SceneManager と TitleScene は作り直さずに使い回す
+        if self.mgr is None or self._title_scene is None:
+            self.mgr = SceneManager()
+            self._title_scene = TitleScene(self, self.mgr)
+        self.mgr.reset(self._title_scene)
 
     def reset_scores(self) -> None:
         self.player_scores = [0 for _ in range(self.player_count)]
@@ -74,8 +79,8 @@ class ReactionVsGame:
             self.mgr.handle_event(event)
 
     def update(self) -> None:
-        if self.mgr and self.mgr.current:
-            self.mgr.current.update()
+        if self.mgr:
+            self.mgr.update()
 
     def draw(self, _px=None) -> None:
         if self.mgr and self.mgr.current:
@@ -1,27 +1,77 @@
 from __future__ import annotations
 
+import functools
 import math
-from dataclasses import dataclass
 from pathlib import Path
 
+import numpy as np
 import pyxel
 
 from ...events import Action, InputEvent
+from ..base import BaseGame
 
 ASSET_RELATIVE_PATH = Path("assets") / "runner" / "images" / "kaira_kun_trans.png"
 
-
-@dataclass
-class Obstacle:
-    """障害物を表すデータクラス"""
-    x: float  # X座標
-    y: int    # Y座標
-    w: int    # 幅
-    h: int    # 高さ
-    passed: bool = False  # プレイヤーが通過したか
+try:  # numba があれば障害物の更新と衝突判定をネイティブコードで行う（任意依存）
+    from numba import njit
+except ImportError:
+    njit = None
+
+
+def _step_obstacles(xs, ys, ws, hs, passed, x2s, y2s, n, speed, player_x, hx1, hy1, hx2, hy2):
+    """
+    障害物の移動・通過判定・画面外の削除・衝突判定を1回のループで行う。
+
+    残った障害物を配列の先頭に詰め、(残った数, 加算スコア, 衝突したか) を返す。
+    """
+    k = 0
+    gained = 0
+    hit = False
+    for i in range(n):
+        x = xs[i] - speed
+        x2 = x + ws[i]
+        if not passed[i] and x2 < player_x:
+            passed[i] = True
+            gained += 1
+        if x2 <= -4:
+            continue
+        xs[k] = x
+        x2s[k] = x2
+        ys[k] = ys[i]
+        ws[k] = ws[i]
+        hs[k] = hs[i]
+        passed[k] = passed[i]
+        y2s[k] = y2s[i]
+        if hx2 >= x and hx1 <= x2 and hy2 >= ys[k] and hy1 <= y2s[k]:
+            hit = True
+        k += 1
+    return k, gained, hit
+
+
+# numba が無い場合は NumPy のまとめ処理（_advance_obstacles / _collides）を使う
+_step_obstacles_jit = njit(cache=True)(_step_obstacles) if njit is not None else None
+
+
+@functools.lru_cache(maxsize=None)
+def _obstacle_bands(h: int) -> tuple[tuple[int, int, int], ...]:
+    """高さ h の障害物の縦グラデーションを (開始行, 行数, 色) の帯にまとめる"""
+    bands: list[list[int]] = []
+    for dy in range(h):
+        ratio = dy / max(h, 1)
+        if ratio < 0.3:
+            color = 12
+        elif ratio < 0.7:
+            color = 5
+        else:
+            color = 1
+        if bands and bands[-1][2] == color:
+            bands[-1][1] += 1
+        else:
+            bands.append([dy, 1, color])
+    return tuple((top, rows, color) for top, rows, color in bands)
 
 
-class RunnerGame:
+class RunnerGame(BaseGame):
     """口を開けてジャンプする横スクロールランナーゲーム"""
 
     width = 256
@@ -46,6 +96,17 @@ class RunnerGame:
     # 障害物のスポーン間隔
     _INITIAL_SPAWN_COOLDOWN = 120
     _MINIMUM_SPAWN_COOLDOWN = 60
+    _OBSTACLE_CAPACITY = 32  # 障害物バッファの初期容量（画面内は高々数個）
+
+    # 地面の下の土のテクスチャ
+    _DIRT_TOP = 4  # 描き始める地面からの深さ
+    _DIRT_COLKEY = 0  # テクスチャ画像の透過色（テクスチャ内で未使用の色）
+    _OBSTACLE_COLKEY = 2  # 障害物画像の透過色（障害物内で未使用の色）
+
+    # ジャンプオーラ用の (cos, sin) 表。オーラの角度は常に5度の倍数なので5度刻みで持つ
+    _AURA_TRIG = tuple(
+        (math.cos(math.radians(d)), math.sin(math.radians(d))) for d in range(0, 360, 5)
+    )
 
     _CLOUD_LAYOUT = (
         (0.3, 40, ((-20, 20), (80, 35), (180, 25))),
@@ -56,6 +117,18 @@ class RunnerGame:
         self.next_game = None
         self.player_image_bank = self._PLAYER_IMAGE_BANK
         self.player_image_loaded = False
+        # 地面の下の土のテクスチャ画像（初回描画時に生成）
+        self._dirt_image: pyxel.Image | None = None
+        # 障害物の (幅, 高さ) ごとの描画済み画像（初めて描くときに生成）
+        self._obstacle_sprites: dict[tuple[int, int], pyxel.Image] = {}
+        # ゲームオーバー中は画面が変化しないので、最初の1フレームを画像に保存して使い回す
+        self._frozen_image: pyxel.Image | None = None
+        self._frozen = False
+        # 星の (基準X, Y, 点滅の位相) と雲の層ごとの (速さ, 周期, 配置) は時間で変わらない
+        self._stars = tuple((i * 37, (i * 23) % (self.height // 3), i * 10) for i in range(20))
+        self._cloud_layers = tuple(
+            (speed, self.width + extra, offsets) for speed, extra, offsets in self._CLOUD_LAYOUT
+        )
         self._load_player_image()
         self._setup_sounds()
         self.reset()
@@ -90,6 +163,15 @@ class RunnerGame:
 
     def _reset_world(self) -> None:
         self.ground_y = int(self.height * 2 / 3)
+        # 空のグラデーションは帯ごとに一色なので、(上端, 下端, 色) を求めておく
+        h = self.height
+        bands = (
+            (0, h // 4, 1),
+            (h // 4, h // 2, 5),
+            (h // 2, self.ground_y, 12),
+            (self.ground_y, h, 3),
+        )
+        self._sky_bands = tuple((y0, y1 - y0, c) for y0, y1, c in bands if y1 > y0)
         self.scroll = self._INITIAL_SCROLL
         self.speed = self._INITIAL_SPEED
         self.accel = self._ACCELERATION
@@ -106,7 +188,18 @@ class RunnerGame:
         self.player_h = self._PLAYER_SIZE
 
     def _reset_obstacles(self) -> None:
-        self.obstacles: list[Obstacle] = []
+        # 障害物は属性ごとの配列で持ち、移動・通過判定・衝突判定をまとめて行う
+        # 配列は確保済みのものを使い回し、先頭 obs_count 個が有効な障害物
+        n = self._OBSTACLE_CAPACITY
+        self.obs_x = np.zeros(n, dtype=np.float64)  # X座標
+        self.obs_y = np.zeros(n, dtype=np.int32)    # Y座標
+        self.obs_w = np.zeros(n, dtype=np.int32)    # 幅
+        self.obs_h = np.zeros(n, dtype=np.int32)    # 高さ
+        self.obs_passed = np.zeros(n, dtype=bool)   # プレイヤーが通過したか
+        # 衝突判定用の右端・下端（x + w, y + h）も列として保持する
+        self.obs_x2 = np.zeros(n, dtype=np.float64)
+        self.obs_y2 = np.zeros(n, dtype=np.int32)
+        self.obs_count = 0
         self.spawn_timer = 0
         self.spawn_cooldown = self._INITIAL_SPAWN_COOLDOWN
 
@@ -115,6 +208,7 @@ class RunnerGame:
         self.best = getattr(self, "best", 0)
         self.game_over = False
         self.frames = 0
+        self._frozen = False
 
     def on_event(self, event: InputEvent) -> None:
         """入力イベントを処理する"""
@@ -146,8 +240,11 @@ class RunnerGame:
         self._update_speed()
         self._update_player_position()
         self._maybe_spawn_obstacle()
-        self._advance_obstacles()
-        self._handle_collisions()
+        if _step_obstacles_jit is not None:
+            self._step_obstacles_native()
+        else:
+            self._advance_obstacles()
+            self._handle_collisions()
 
     def _update_speed(self) -> None:
         self.speed = min(self.max_speed, self.speed + self.accel)
@@ -174,34 +271,81 @@ class RunnerGame:
         obstacle_height = base_height + height_variation
         obstacle_width = 15 + ((self.frames // 240) % 3) * 3
 
-        obstacle = Obstacle(
-            x=self.width + 8,
-            y=self.ground_y - obstacle_height + 1,
-            w=obstacle_width,
-            h=obstacle_height,
-        )
-        self.obstacles.append(obstacle)
+        i = self.obs_count
+        if i == len(self.obs_x):
+            self._grow_obstacles()
+        self.obs_x[i] = self.width + 8
+        self.obs_y[i] = self.ground_y - obstacle_height + 1
+        self.obs_w[i] = obstacle_width
+        self.obs_h[i] = obstacle_height
+        self.obs_passed[i] = False
+        self.obs_x2[i] = self.obs_x[i] + obstacle_width
+        self.obs_y2[i] = self.obs_y[i] + obstacle_height
+        self.obs_count = i + 1
 
         # スポーン間隔を徐々に短くする
         self.spawn_cooldown = max(self._MINIMUM_SPAWN_COOLDOWN, self.spawn_cooldown - 1)
         gap = self.spawn_cooldown + (self.frames % 30)
         self.spawn_timer = gap
 
+    def _grow_obstacles(self) -> None:
+        """障害物バッファの容量を倍にする（通常は発生しない）"""
+        n = len(self.obs_x) * 2
+        self.obs_x = np.resize(self.obs_x, n)
+        self.obs_y = np.resize(self.obs_y, n)
+        self.obs_w = np.resize(self.obs_w, n)
+        self.obs_h = np.resize(self.obs_h, n)
+        self.obs_passed = np.resize(self.obs_passed, n)
+        self.obs_x2 = np.resize(self.obs_x2, n)
+        self.obs_y2 = np.resize(self.obs_y2, n)
+
     def _advance_obstacles(self) -> None:
         """障害物を左に移動させ、通過したらスコアを加算する"""
-        for obstacle in self.obstacles:
-            obstacle.x -= self.speed
-            if not obstacle.passed and obstacle.x + obstacle.w < self.px:
-                obstacle.passed = True
-                self.score += 1
-
-        # 画面外の障害物を削除
-        self.obstacles = [o for o in self.obstacles if o.x + o.w > -4]
+        n = self.obs_count
+        if n == 0:
+            return
+        xs = self.obs_x[:n]
+        passed = self.obs_passed[:n]
+        right = self.obs_x2[:n]
+        xs -= self.speed
+        np.add(xs, self.obs_w[:n], out=right)
+        newly_passed = ~passed & (right < self.px)
+        if newly_passed.any():
+            passed |= newly_passed
+            self.score += int(newly_passed.sum())
+
+        # 画面外の障害物を削除（残すものを前に詰める）
+        keep = right > -4
+        if not keep.all():
+            idx = np.flatnonzero(keep)
+            k = len(idx)
+            for arr in (
+                self.obs_x, self.obs_y, self.obs_w, self.obs_h,
+                self.obs_passed, self.obs_x2, self.obs_y2,
+            ):
+                arr[:k] = arr[idx]
+            self.obs_count = k
+
+    def _step_obstacles_native(self) -> None:
+        """numba でコンパイルした関数で障害物の更新と衝突判定をまとめて行う"""
+        hx1, hy1, hx2, hy2 = self._player_hitbox()
+        count, gained, hit = _step_obstacles_jit(
+            self.obs_x, self.obs_y, self.obs_w, self.obs_h,
+            self.obs_passed, self.obs_x2, self.obs_y2,
+            self.obs_count, self.speed, self.px, hx1, hy1, hx2, hy2,
+        )
+        self.obs_count = count
+        self.score += gained
+        if hit:
+            self._end_game()
 
     def _handle_collisions(self) -> None:
         if self._collides():
-            self.game_over = True
-            self.best = max(self.best, self.score)
+            self._end_game()
+
+    def _end_game(self) -> None:
+        self.game_over = True
+        self.best = max(self.best, self.score)
 
     def _player_hitbox(self) -> tuple[float, float, float, float]:
         """プレイヤーの当たり判定を計算する（x1, y1, x2, y2）"""
@@ -221,23 +365,35 @@ class RunnerGame:
     def _collides(self) -> bool:
         """プレイヤーと障害物の衝突判定を行う"""
         px1, py1, px2, py2 = self._player_hitbox()
-        for obstacle in self.obstacles:
-            ox1 = obstacle.x
-            oy1 = obstacle.y
-            ox2 = obstacle.x + obstacle.w
-            oy2 = obstacle.y + obstacle.h
-            # 矩形の衝突判定
-            if not (px2 < ox1 or px1 > ox2 or py2 < oy1 or py1 > oy2):
-                return True
-        return False
+        n = self.obs_count
+        # 矩形の衝突判定を全障害物に対してまとめて行う（分岐なし）
+        hits = (
+            (px2 >= self.obs_x[:n])
+            & (px1 <= self.obs_x2[:n])
+            & (py2 >= self.obs_y[:n])
+            & (py1 <= self.obs_y2[:n])
+        )
+        return bool(hits.any())
 
     def draw(self, px) -> None:
         """ゲーム画面を描画する"""
+        if self._frozen:
+            px.blt(0, 0, self._frozen_image, 0, 0, self.width, self.height)
+            return
         self._draw_background(px)
         self._draw_ground(px)
         self._draw_obstacles(px)
         self._draw_player(px)
         self._draw_ui(px)
+        if self.game_over:
+            self._freeze_frame(px)
+
+    def _freeze_frame(self, px) -> None:
+        """ゲームオーバー画面を保存し、以降の描画を画像の転送だけにする"""
+        if self._frozen_image is None:
+            self._frozen_image = pyxel.Image(self.width, self.height)
+        self._frozen_image.blt(0, 0, px.screen, 0, 0, self.width, self.height)
+        self._frozen = True
 
     def _draw_background(self, px) -> None:
         self._draw_sky_gradient(px)
@@ -246,29 +402,22 @@ class RunnerGame:
 
     def _draw_sky_gradient(self, px) -> None:
         """グラデーションの空を描画する"""
-        for y in range(self.height):
-            if y < self.height // 4:
-                color = 1
-            elif y < self.height // 2:
-                color = 5
-            elif y < self.ground_y:
-                color = 12
-            else:
-                color = 3
-            px.line(0, y, self.width, y, color)
+        w = self.width
+        for y, h, color in self._sky_bands:
+            px.rect(0, y, w, h, color)
 
     def _draw_stars(self, px) -> None:
         """点滅する星を描画する"""
-        for i in range(20):
-            star_x = (i * 37 + int(self.frames * 0.1)) % self.width
-            star_y = (i * 23) % (self.height // 3)
-            if (self.frames + i * 10) % 60 < 30:
-                px.pset(star_x, star_y, 7)
+        frames = self.frames
+        shift = int(frames * 0.1)
+        w = self.width
+        for base_x, star_y, phase in self._stars:
+            if (frames + phase) % 60 < 30:
+                px.pset((base_x + shift) % w, star_y, 7)
 
     def _draw_clouds(self, px) -> None:
         """流れる雲を描画する"""
-        for speed, extra, offsets in self._CLOUD_LAYOUT:
-            span = self.width + extra
+        for speed, span, offsets in self._cloud_layers:
             base_offset = int((self.frames * speed) % span)
             for offset_x, offset_y in offsets:
                 self._draw_cloud(px, base_offset + offset_x, offset_y)
@@ -298,56 +447,82 @@ class RunnerGame:
         px.line(0, self.ground_y + 2, self.width, self.ground_y + 2, 3)
         px.line(0, self.ground_y + 3, self.width, self.ground_y + 3, 5)
 
-        # 地面の下の土のテクスチャ
+        # 地面の下の土のテクスチャ（スクロールしないので画像を貼るだけ）
+        if self._dirt_image is None:
+            self._dirt_image = self._render_dirt()
+        img = self._dirt_image
+        top = self.ground_y + self._DIRT_TOP
+        px.blt(0, top, img, 0, 0, img.width, img.height, self._DIRT_COLKEY)
+
+    def _render_dirt(self) -> pyxel.Image:
+        top = self._DIRT_TOP
         ground_depth = self.height - self.ground_y
+        img = pyxel.Image(self.width, max(1, ground_depth - top))
+        img.cls(self._DIRT_COLKEY)
         for x in range(0, self.width, 8):
-            for dy in range(4, ground_depth, 3):
+            for dy in range(top, ground_depth, 3):
+                y = dy - top
                 if (x + dy) % 16 < 8:
-                    px.pset(x + 4, self.ground_y + dy, 5)
+                    img.pset(x + 4, y, 5)
                 if (x * 7 + dy * 3) % 30 < 2:
-                    px.pset(x + 2, self.ground_y + dy, 13)
+                    img.pset(x + 2, y, 13)
                 if dy > ground_depth // 2 and (x + dy) % 20 < 5:
-                    px.pset(x, self.ground_y + dy, 1)
+                    img.pset(x, y, 1)
+        return img
 
     def _draw_obstacles(self, px) -> None:
         """障害物を描画する（グラデーション、影付き）"""
-        for obstacle in self.obstacles:
-            ox = int(obstacle.x)
-            oy = int(obstacle.y)
-
-            # グラデーション塗りつぶし
-            for dy in range(obstacle.h):
-                ratio = dy / max(obstacle.h, 1)
-                if ratio < 0.3:
-                    color = 12
-                elif ratio < 0.7:
-                    color = 5
-                else:
-                    color = 1
-                px.line(ox, oy + dy, ox + obstacle.w - 1, oy + dy, color)
-
-            # 輪郭
-            px.rectb(ox, oy, obstacle.w, obstacle.h, 0)
-
-            # ハイライト
-            if obstacle.w > 5 and obstacle.h > 5:
-                px.line(ox + 2, oy + 2, ox + obstacle.w - 3, oy + 2, 7)
-                px.pset(ox + 2, oy + 3, 7)
-                px.pset(ox + 3, oy + 2, 7)
-                if obstacle.w > 10:
-                    px.pset(ox + obstacle.w - 4, oy + 4, 12)
-                    px.pset(ox + obstacle.w - 5, oy + 5, 12)
-
-            # 影
-            shadow_length = 2
-            for i in range(shadow_length):
-                px.line(
-                    ox - i,
-                    oy + obstacle.h + i,
-                    ox + obstacle.w - i,
-                    oy + obstacle.h + i,
-                    0,
-                )
+        n = self.obs_count
+        sprites = self._obstacle_sprites
+        for x, oy, ow, oh in zip(
+            self.obs_x[:n].tolist(),
+            self.obs_y[:n].tolist(),
+            self.obs_w[:n].tolist(),
+            self.obs_h[:n].tolist(),
+        ):
+            sprite = sprites.get((ow, oh))
+            if sprite is None:
+                sprite = sprites[ow, oh] = self._render_obstacle(ow, oh)
+            # 影が左に1ドットはみ出すので、その分ずらして貼る
+            w, h = sprite.width, sprite.height
+            px.blt(int(x) - 1, oy, sprite, 0, 0, w, h, self._OBSTACLE_COLKEY)
+
+    def _render_obstacle(self, ow: int, oh: int) -> pyxel.Image:
+        # 障害物の見た目は大きさだけで決まるので、大きさごとに一度だけ画像に描いておく
+        img = pyxel.Image(ow + 2, oh + 2)
+        img.cls(self._OBSTACLE_COLKEY)
+        self._draw_obstacle_shape(img, 1, 0, ow, oh)
+        return img
+
+    @staticmethod
+    def _draw_obstacle_shape(target, ox: int, oy: int, ow: int, oh: int) -> None:
+        # target は pyxel モジュール、または pyxel.Image
+        # グラデーション塗りつぶし（色ごとの帯を矩形1つで塗る）
+        for top, rows, color in _obstacle_bands(oh):
+            target.rect(ox, oy + top, ow, rows, color)
+
+        # 輪郭
+        target.rectb(ox, oy, ow, oh, 0)
+
+        # ハイライト
+        if ow > 5 and oh > 5:
+            target.line(ox + 2, oy + 2, ox + ow - 3, oy + 2, 7)
+            target.pset(ox + 2, oy + 3, 7)
+            target.pset(ox + 3, oy + 2, 7)
+            if ow > 10:
+                target.pset(ox + ow - 4, oy + 4, 12)
+                target.pset(ox + ow - 5, oy + 5, 12)
+
+        # 影
+        shadow_length = 2
+        for i in range(shadow_length):
+            target.line(
+                ox - i,
+                oy + oh + i,
+                ox + ow - i,
+                oy + oh + i,
+                0,
+            )
 
     def _draw_player(self, px) -> None:
         """プレイヤーを描画する"""
@@ -381,10 +556,14 @@ class RunnerGame:
         radius_y = self.player_h // 2 + 3
         center_x = self.px
         center_y = self.py - self.player_h // 2
-        for angle_deg in range(0, 360, 45):
-            angle = math.radians(angle_deg + self.frames * 10)
-            aura_x = int(center_x + math.cos(angle) * radius_x)
-            aura_y = int(center_y + math.sin(angle) * radius_y)
+        trig = self._AURA_TRIG
+        n = len(trig)
+        # 45度ずつ8点。回転は1フレームあたり10度（表の2つ分）
+        base = self.frames * 2
+        for step in range(0, n, 9):
+            cos_a, sin_a = trig[(base + step) % n]
+            aura_x = int(center_x + cos_a * radius_x)
+            aura_y = int(center_y + sin_a * radius_y)
             px.pset(aura_x, aura_y, color)
 
     def _draw_ui(self, px) -> None:
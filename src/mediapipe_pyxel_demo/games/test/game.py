@@ -4,30 +4,33 @@ from dataclasses import dataclass
 from typing import Dict
 import time
 
+import pyxel
+
 from ...events import Action, InputEvent
+from ..base import BaseGame
 
 
 @dataclass
 class Flash:
-    # 直近の入力のフラッシュ表示管理
+    # 直近の入力のフラッシュ表示管理（時間はゲームのフレーム数で数える）
     active: bool = False
-    t_on: float = 0.0
-    duration: float = 0.25  # 秒
+    frame_on: int = 0
+    duration: int = 8  # フレーム（Pyxel 既定の 30fps で約0.25秒）
 
-    def trigger(self) -> None:
+    def trigger(self, frame: int) -> None:
         self.active = True
-        self.t_on = time.time()
+        self.frame_on = frame
 
-    def on(self) -> bool:
+    def on(self, frame: int) -> bool:
         if not self.active:
             return False
-        if time.time() - self.t_on > self.duration:
+        if frame - self.frame_on > self.duration:
             self.active = False
             return False
         return True
 
 
-class TestGame:
+class TestGame(BaseGame):
     """
     入力テスト用ゲーム。
 
@@ -50,6 +53,26 @@ class TestGame:
         }
         self.last_event: str = "-"
         self.start_time = time.time()
+        self.frames = 0  # update の呼び出し回数（フラッシュの時間計測に使う）
+        # 背景・タイトル・説明・パネル枠のキャッシュ画像（初回描画時に生成）
+        self._bg_img = None
+        self._bg_ready = False
+
+    def _setup_background(self) -> None:
+        # 変化しない部分は一度だけ画像に描いておき、毎フレームは1回の blt で済ませる
+        bg = pyxel.Image(self.width, self.height)
+        self._draw_static(bg)
+        self._bg_img = bg
+        self._bg_ready = True
+
+    def _ensure_background(self) -> None:
+        if self._bg_ready:
+            return
+        try:
+            self._setup_background()
+        except Exception:
+            # Pyxel 未初期化などで失敗した場合は次フレームで再試行
+            self._bg_ready = False
 
     # --- 入力 ---
     def on_event(self, e: InputEvent) -> None:
@@ -58,7 +81,7 @@ class TestGame:
             return
         if e.action in (Action.ACTION1, Action.ACTION2, Action.ACTION3):
             self.counts[e.action] = self.counts.get(e.action, 0) + 1
-            self.flash[e.action].trigger()
+            self.flash[e.action].trigger(self.frames)
             self.last_event = f"{e.action.name}  val={e.value:.2f}"
 
     def _return_to_menu(self) -> None:
@@ -68,33 +91,17 @@ class TestGame:
 
     # --- 更新 ---
     def update(self) -> None:
-        # 特にロジックは不要。フラッシュは時間で自動オフ。
-        pass
+        # フレーム数を進めるだけ。フラッシュは一定フレーム経過で自動オフ。
+        self.frames += 1
 
     # --- 描画 ---
     def draw(self, px) -> None:
-        # 背景
-        px.cls(0)
-        for y in range(0, self.height, 8):
-            c = 1 if (y // 8) % 2 == 0 else 5
-            px.line(0, y, self.width, y, c)
-
-        # タイトル
-        title = "INPUT TEST"
-        tx = self.width // 2 - len(title) * 2
-        for dx, dy in ((-1,0),(1,0),(0,-1),(0,1)):
-            px.text(tx+dx, 8+dy, title, 0)
-        px.text(tx, 8, title, 7)
-
-        # 説明
-        px.text(10, 24, "Press inputs to verify.", 6)
-        px.text(10, 34, "ACTION1: Space / Blink", 7)
-        px.text(10, 42, "ACTION2: Enter / Mouth", 7)
-        px.text(10, 50, "ACTION3: Smile", 7)
-        px.text(10, 58, "ESC: Quit", 5)
-
-        # パネル枠
-        px.rectb(8, 72, self.width - 16, 128, 10)
+        # 背景・タイトル・説明・パネル枠（固定部分）
+        self._ensure_background()
+        if self._bg_ready:
+            px.blt(0, 0, self._bg_img, 0, 0, self.width, self.height)
+        else:
+            self._draw_static(px)
 
         # ラベル + カウント + フラッシュインジケータ
         rows = [
@@ -108,7 +115,7 @@ class TestGame:
             cnt = self.counts.get(act, 0)
             px.text(20, y + 10, f"COUNT: {cnt}", 11)
             # ランプ
-            on = self.flash[act].on()
+            on = self.flash[act].on(self.frames)
             col = 8 if not on else 11
             px.circ(112, y + 6, 5, 0)
             px.circ(112, y + 6, 4, col)
@@ -124,6 +131,31 @@ class TestGame:
         # 直近イベント
         px.text(10, 200, f"LAST: {self.last_event}", 6)
 
+    def _draw_static(self, target) -> None:
+        # target は pyxel モジュール、または pyxel.Image
+        # 背景
+        target.cls(0)
+        for y in range(0, self.height, 8):
+            c = 1 if (y // 8) % 2 == 0 else 5
+            target.line(0, y, self.width, y, c)
+
+        # タイトル
+        title = "INPUT TEST"
+        tx = self.width // 2 - len(title) * 2
+        for dx, dy in ((-1,0),(1,0),(0,-1),(0,1)):
+            target.text(tx+dx, 8+dy, title, 0)
+        target.text(tx, 8, title, 7)
+
+        # 説明
+        target.text(10, 24, "Press inputs to verify.", 6)
+        target.text(10, 34, "ACTION1: Space / Blink", 7)
+        target.text(10, 42, "ACTION2: Enter / Mouth", 7)
+        target.text(10, 50, "ACTION3: Smile", 7)
+        target.text(10, 58, "ESC: Quit", 5)
+
+        # パネル枠
+        target.rectb(8, 72, self.width - 16, 128, 10)
+
 
 # レジストリが参照する公開シンボル
 GAME_CLASS = TestGame
@@ -1,15 +1,25 @@
 from __future__ import annotations
 
-from queue import Queue
-from typing import Protocol
+from ..events import EventBuffer
+from typing import Callable, Optional, Protocol
 
 
 class ThreadedProvider(Protocol):
-    def start(self, out_queue: Queue) -> None: ...
+    def start(self, out_queue: EventBuffer) -> None: ...
     def stop(self) -> None: ...
 
 
 class PollingProvider(Protocol):
-    def poll(self, px, out_queue: Queue) -> None: ...
+    def poll(self, px, out_queue: EventBuffer) -> None: ...
 
 
+class BaseProvider:
+    """
+    入力プロバイダの共通基底クラス。
+
+    App は `start` / `poll` を直接参照するため、未実装のフックは None としておく。
+    """
+
+    start: Optional[Callable[[EventBuffer], None]] = None
+    stop: Optional[Callable[[], None]] = None
+    poll: Optional[Callable[..., None]] = None
@@ -1,12 +1,12 @@
 from __future__ import annotations
 
-from queue import Queue
 from typing import Optional
 
-from ..events import Action, InputEvent
+from . import BaseProvider
+from ..events import SOURCE_KEYBOARD, Action, EventBuffer, InputEvent
 
 
-class KeyboardProvider:
+class KeyboardProvider(BaseProvider):
     """
     Pyxel のキーボード状態をポーリングするデバッグ用入力プロバイダ。
     - Space -> ACTION1
@@ -20,22 +20,24 @@ class KeyboardProvider:
         self._last_enter = False
         self._last_escape = False
         self._note = note
+        # (キーコード, アクション) の組。キーコードは Pyxel が使えるようになってから初回の poll で求める
+        self._bindings: Optional[tuple[tuple[int, Action], ...]] = None
 
-    def poll(self, px, out_queue: Queue) -> None:  # type: ignore[override]
+    def poll(self, px, out_queue: EventBuffer) -> None:  # type: ignore[override]
         # Pyxel が利用可能になった後にキーコードへアクセスする（遅延参照）
         if px is None:
             return
 
-        space = px.btnp(px.KEY_SPACE)
-        enter = px.btnp(px.KEY_RETURN)
-        shift = px.btnp(px.KEY_SHIFT)
-        esc = px.btnp(px.KEY_ESCAPE)
-
-        if space:
-            out_queue.put(InputEvent(action=Action.ACTION1, note=self._note))
-        if enter:
-            out_queue.put(InputEvent(action=Action.ACTION2, note=self._note))
-        if shift:
-            out_queue.put(InputEvent(action=Action.ACTION3, note=self._note))
-        if esc:
-            out_queue.put(InputEvent(action=Action.QUIT, note=self._note))
+        bindings = self._bindings
+        if bindings is None:
+            bindings = self._bindings = (
+                (px.KEY_SPACE, Action.ACTION1),
+                (px.KEY_RETURN, Action.ACTION2),
+                (px.KEY_SHIFT, Action.ACTION3),
+                (px.KEY_ESCAPE, Action.QUIT),
+            )
+
+        btnp = px.btnp
+        for key, action in bindings:
+            if btnp(key):
+                out_queue.put(InputEvent(action=action, note=self._note, source=SOURCE_KEYBOARD))
@@ -1,16 +1,90 @@
 from __future__ import annotations
 
+import functools
+import logging
 import os
 import threading
 import time
-from queue import Queue
 from typing import Any, Optional, Tuple, Dict
 
 import cv2
 
-from ..events import Action, InputEvent
-
-class FaceProvider:
+from . import BaseProvider
+from ..events import SOURCE_FACE, Action, EventBuffer, InputEvent
+
+logger = logging.getLogger(__name__)
+
+# 判定に使う blendshape のカテゴリ名（小文字）。結果はこの並びのタプルで受け渡す
+_BLENDSHAPE_NAMES = (
+    "eyeblinkleft",
+    "eyeblinkright",
+    "eyesquintleft",
+    "eyesquintright",
+    "jawopen",
+    "mouthclose",
+    "mouthsmileleft",
+    "mouthsmileright",
+    "mouthcornerpullleft",
+    "mouthcornerpullright",
+)
+(
+    _BLINK_L,
+    _BLINK_R,
+    _SQUINT_L,
+    _SQUINT_R,
+    _JAW_OPEN,
+    _MOUTH_CLOSE,
+    _SMILE_L,
+    _SMILE_R,
+    _CORNER_PULL_L,
+    _CORNER_PULL_R,
+) = range(len(_BLENDSHAPE_NAMES))
+
+# 顔が見つからない結果がこの回数を超えて続いたら、推論を _IDLE_STRIDE フレームに1回へ間引く
+_IDLE_AFTER = 2
+_IDLE_STRIDE = 3
+
+# poll で ON/OFF を追跡する動作のビット
+_BLINK_BIT = 1
+_MOUTH_BIT = 2
+_SMILE_BIT = 4
+
+# blendshape 値のタプル（_BLENDSHAPE_NAMES の順。結果に無いカテゴリは None）
+Scores = Tuple[Optional[float], ...]
+# 動作ごとの値 (まばたき, 口の開き, 笑顔)。求められなかった動作は None
+Gestures = Tuple[Optional[float], Optional[float], Optional[float]]
+
+
+def _prewarm_mediapipe() -> None:
+    # MediaPipe の import は重いので裏で済ませておく（start() の import はキャッシュ参照だけになる）
+    try:
+        import mediapipe  # type: ignore  # noqa: F401
+        from mediapipe.tasks import python  # type: ignore  # noqa: F401
+        from mediapipe.tasks.python import vision  # type: ignore  # noqa: F401
+    except Exception:
+        # 失敗は start() 側で改めて報告する
+        pass
+
+
+_prewarm_started = False
+
+
+def _start_prewarm() -> None:
+    global _prewarm_started
+    if _prewarm_started:
+        return
+    _prewarm_started = True
+    threading.Thread(target=_prewarm_mediapipe, name="MediaPipePrewarm", daemon=True).start()
+
+
+@functools.lru_cache(maxsize=None)
+def _read_model(path: str) -> bytes:
+    # モデルファイルは一度だけ読み、再起動や複数プロバイダ（対戦モード）で使い回す
+    with open(path, "rb") as f:
+        return f.read()
+
+
+class FaceProvider(BaseProvider):
     """
     - まばたき -> ACTION1 (Space)
     - 口の開き具合 -> ACTION2 (Enter)
@@ -31,21 +105,30 @@ class FaceProvider:
         fps: int | None = 15,
         buffersize: int = 1,
         use_mjpeg: bool = True,
+        use_yuyv: bool = False,  # YUYV を無変換で受け取り、RGB へ直接変換する（use_mjpeg より優先）
         hysteresis: float = 0.05,  # ON/OFFの二段閾値（0で無効）
         smile_threshold: float = 0.5,
         delegate: str | None = "GPU",  # 'CPU' or 'GPU' を指定可能（Noneでデフォルト）
+        max_input_side: int = 256,  # 推論に渡す画像の長辺の上限（0で縮小しない）
     ) -> None:
+        # MediaPipe の import をカメラの初期化と並行して裏で進めておく
+        _start_prewarm()
 
         # 閾値（ヒステリシス対応）
         self._blink_on = float(blink_threshold)
         self._blink_off = float(max(0.0, blink_threshold - hysteresis))
         self._mouth_on = float(mouth_threshold)
         self._mouth_off = float(max(0.0, mouth_threshold - hysteresis))
-        self._last_blink_active = False
-        self._last_mouth_active = False
         self._smile_on = float(smile_threshold)
         self._smile_off = float(max(0.0, smile_threshold - hysteresis))
-        self._last_smile_active = False
+        # 直前のフレームで ON だった動作のビットの組（_BLINK_BIT / _MOUTH_BIT / _SMILE_BIT）
+        self._active_mask = 0
+        # 動作ごとの (ビット, ON閾値, OFF閾値, 出すアクション)。Gestures と同じ順で、poll はこの順に発行する
+        self._gestures = (
+            (_BLINK_BIT, self._blink_on, self._blink_off, Action.ACTION1),
+            (_MOUTH_BIT, self._mouth_on, self._mouth_off, Action.ACTION2),
+            (_SMILE_BIT, self._smile_on, self._smile_off, Action.ACTION3),
+        )
         self._player_index = player_index
         self._camera_index = int(camera_index)
         if event_note is not None:
@@ -80,7 +163,14 @@ class FaceProvider:
             self._cap.set(cv2.CAP_PROP_BUFFERSIZE, int(buffersize))
         except Exception:
             pass
-        if use_mjpeg:
+        if use_yuyv:
+            # MJPG のデコードと BGR 変換を省き、YUYV から一度で RGB にする（未対応のカメラでは BGR のまま届く）
+            try:
+                self._cap.set(cv2.CAP_PROP_FOURCC, cv2.VideoWriter_fourcc(*"YUYV"))
+                self._cap.set(cv2.CAP_PROP_CONVERT_RGB, 0)
+            except Exception:
+                pass
+        elif use_mjpeg:
             try:
                 fourcc = cv2.VideoWriter_fourcc(*"MJPG")
                 self._cap.set(cv2.CAP_PROP_FOURCC, fourcc)
@@ -91,25 +181,44 @@ class FaceProvider:
         self._skip_stride = self._frame_skip + 1
         self._time_base = time.monotonic()
         self._last_sent_ts_ms: int = -1
-        self._result_lock = threading.Lock()
-        # 最新のblendshape辞書とタイムスタンプのみ保持
-        self._latest_result: Optional[Tuple[Optional[Dict[str, float]], int]] = None
+        # 最新の動作ごとの値とタイムスタンプのみ保持。書き込みはコールバック、読み出しは poll の
+        # それぞれ1スレッドだけで、タプルごと1回の代入で差し替えるのでロックは使わない
+        self._latest_result: Optional[Tuple[Optional[Gestures], int]] = None
         self._last_processed_ts: int = -1
+        # 顔が見つからなかった結果の連続回数（コールバックのみが書き込む）
+        self._empty_results = 0
+        # 必要な各カテゴリの結果内の位置（無ければ -1）。モデルごとに並びは固定なので最初の結果で一度だけ求める
+        self._blend_index: Optional[Tuple[int, ...]] = None
+        self._blend_count = 0  # _blend_index を求めたときのカテゴリ数
         self._running = False
         self._worker: Optional[threading.Thread] = None
+        # カメラ読み込みスレッドから推論スレッドへ渡す最新フレーム（1枚だけ保持し、古いものは上書き）
+        self._capture_thread: Optional[threading.Thread] = None
+        self._frame_slot = None
+        self._frame_lock = threading.Lock()
+        self._frame_ready = threading.Event()
+        # stop() で立てる。待機中のスレッドをすぐに抜けさせる
+        self._stop_event = threading.Event()
 
         # MediaPipe関連は遅延初期化
         self._detector = None  # type: ignore[assignment]
         self._mp_image_cls = None  # type: ignore[assignment]
         self._mp_format = None  # type: ignore[assignment]
         self._use_srgba = False  # GPU delegate時は SRGBA、CPU時は SRGB
+        self._cvt_code = cv2.COLOR_BGR2RGB  # カメラ画像(BGR)から _mp_format への変換
+        self._yuyv_code = cv2.COLOR_YUV2RGB_YUYV  # カメラ画像(YUYV)から _mp_format への変換
+        # 色変換の出力先（フレームごとに確保しないよう使い回す。サイズが変わったら作り直す）
+        self._color_buf = None
+        # カメラが指定より大きい画像を返す場合に備え、推論前に縮小する（出力先は使い回す）
+        self._max_input_side = max(0, int(max_input_side))
+        self._resize_buf = None
 
         # モデルパスは保持
         base_dir = os.path.dirname(os.path.dirname(os.path.dirname(os.path.dirname(__file__))))
         self._model_path = os.path.join(base_dir, "assets/models", "face_landmarker.task")
         self._delegate = delegate
 
-    def start(self, _out_queue: Queue | None = None) -> None:
+    def start(self, _out_queue: EventBuffer | None = None) -> None:
         if self._running:
             return
 
@@ -122,7 +231,11 @@ class FaceProvider:
             except Exception as e:
                 raise RuntimeError(f"Failed to import MediaPipe: {e}") from e
 
-            base_opts_kwargs: dict[str, Any] = {"model_asset_path": self._model_path}
+            try:
+                base_opts_kwargs: dict[str, Any] = {"model_asset_buffer": _read_model(self._model_path)}
+            except OSError:
+                # 読めない場合はパス指定にして MediaPipe 側のエラーに任せる
+                base_opts_kwargs = {"model_asset_path": self._model_path}
             is_gpu = False
 
             # Windows では GPU delegate 未サポートのため強制的に CPU を使用
@@ -149,14 +262,15 @@ class FaceProvider:
                 result_callback=self._on_async_result,
             )
 
-            # GPU 未サポートエラー時に CPU にフォールバック
+            # GPU 未サポート・初期化失敗時に CPU にフォールバック
             try:
                 self._detector = vision.FaceLandmarker.create_from_options(options)
-            except NotImplementedError as e:
+            except (NotImplementedError, RuntimeError) as e:
                 msg = str(e)
                 if "GPU Delegate is not yet supported" in msg or delegate_upper == "GPU":
                     base_opts_kwargs["delegate"] = python.BaseOptions.Delegate.CPU
                     is_gpu = False
+                    delegate_upper = "CPU"
                     options = vision.FaceLandmarkerOptions(
                         base_options=python.BaseOptions(**base_opts_kwargs),
                         output_face_blendshapes=True,
@@ -165,22 +279,43 @@ class FaceProvider:
                         result_callback=self._on_async_result,
                     )
                     self._detector = vision.FaceLandmarker.create_from_options(options)
+                    logger.info("GPU delegate unavailable, falling back to CPU: %s", msg)
                 else:
                     raise
+            logger.info(
+                "FaceLandmarker delegate: %s", "GPU" if is_gpu else (delegate_upper or "default")
+            )
 
             self._mp_image_cls = mp.Image
             self._use_srgba = is_gpu
             self._mp_format = mp.ImageFormat.SRGBA if is_gpu else mp.ImageFormat.SRGB
+            self._cvt_code = cv2.COLOR_BGR2RGBA if is_gpu else cv2.COLOR_BGR2RGB
+            self._yuyv_code = cv2.COLOR_YUV2RGBA_YUYV if is_gpu else cv2.COLOR_YUV2RGB_YUYV
 
+        # 色変換・縮小は小さな画像にしか使わないので OpenCV のスレッドプールは使わない
+        # （MediaPipe の推論スレッドと CPU を取り合わないようにする。設定はプロセス全体に効く）
+        try:
+            cv2.setNumThreads(1)
+        except Exception:
+            pass
+
+        self._stop_event.clear()
         self._running = True
+        self._capture_thread = threading.Thread(
+            target=self._run_capture, name="FaceProviderCapture", daemon=True
+        )
         self._worker = threading.Thread(target=self._run_worker, name="FaceProviderWorker", daemon=True)
+        self._capture_thread.start()
         self._worker.start()
 
     def stop(self) -> None:
         self._running = False
-        worker = self._worker
-        if worker and worker.is_alive():
-            worker.join(timeout=1.0)
+        self._stop_event.set()
+        self._frame_ready.set()  # フレーム待ちの推論スレッドも起こす
+        for worker in (self._capture_thread, self._worker):
+            if worker and worker.is_alive():
+                worker.join(timeout=1.0)
+        self._capture_thread = None
         self._worker = None
 
         # Detector/Cameraの明示的クローズ
@@ -196,30 +331,54 @@ class FaceProvider:
         except Exception:
             pass
 
-    def _run_worker(self) -> None:
+    def _run_capture(self) -> None:
+        # カメラからの読み込みだけを行い、推論が遅れてもドライバのキューを溜めない
         skip_counter = 0
         while self._running:
+            if not self._cap.grab():
+                if self._stop_event.wait(0.01):
+                    break
+                continue
             if self._frame_skip > 0:
-                grabbed = self._cap.grab()
-                if not grabbed:
-                    time.sleep(0.01)
-                    continue
                 skip_counter = (skip_counter + 1) % self._skip_stride
                 if skip_counter != 0:
                     continue
-                ok, frame_bgr = self._cap.retrieve()
-            else:
-                ok, frame_bgr = self._cap.read()
+            ok, frame_bgr = self._cap.retrieve()
             if not ok or frame_bgr is None:
-                time.sleep(0.01)
+                if self._stop_event.wait(0.01):
+                    break
                 continue
+            with self._frame_lock:
+                self._frame_slot = frame_bgr
+            self._frame_ready.set()
 
-            if self._use_srgba:
-                rgba = cv2.cvtColor(frame_bgr, cv2.COLOR_BGR2RGBA)
-                mp_image = self._mp_image_cls(image_format=self._mp_format, data=rgba)
+    def _run_worker(self) -> None:
+        idle_counter = 0
+        while self._running:
+            # 新しいフレームを待つ（stop() でも起こされる）
+            if not self._frame_ready.wait(0.1):
+                continue
+            with self._frame_lock:
+                frame_bgr = self._frame_slot
+                self._frame_slot = None
+                self._frame_ready.clear()
+            if frame_bgr is None:
+                continue
+            # 顔が映っていない間は推論（と色変換）を間引く。見つかれば毎フレームに戻る
+            if self._empty_results > _IDLE_AFTER:
+                idle_counter = (idle_counter + 1) % _IDLE_STRIDE
+                if idle_counter != 0:
+                    continue
             else:
-                rgb = cv2.cvtColor(frame_bgr, cv2.COLOR_BGR2RGB)
-                mp_image = self._mp_image_cls(image_format=self._mp_format, data=rgb)
+                idle_counter = 0
+
+            if frame_bgr.ndim == 3 and frame_bgr.shape[2] == 2:
+                # YUYV は画素の組で色を持つのでそのまま縮小できない。先に変換する
+                buf = self._shrink_frame(self._convert_color(frame_bgr, self._yuyv_code))
+            else:
+                # 縮小してから色変換する（変換する画素数も減る）
+                buf = self._convert_color(self._shrink_frame(frame_bgr), self._cvt_code)
+            mp_image = self._mp_image_cls(image_format=self._mp_format, data=buf)
             # MediapipeのLIVE_STREAMは単調増加のタイムスタンプが必須。
             # ミリ秒に切り捨てるため連続ループで同値になることがあるので補正する。
             timestamp_ms = int((time.monotonic() - self._time_base) * 1000)
@@ -231,24 +390,48 @@ class FaceProvider:
                 self._detector.detect_async(mp_image, timestamp_ms)
                 self._last_sent_ts_ms = timestamp_ms
             except RuntimeError:
-                time.sleep(0.01)
+                if self._stop_event.wait(0.01):
+                    break
                 continue
 
-    def _consume_latest_result(self) -> Optional[Tuple[Optional[Dict[str, float]], int]]:
-        with self._result_lock:
-            latest = self._latest_result
-            if not latest:
-                return None
-            result, ts_ms = latest
-            if ts_ms == self._last_processed_ts:
-                return None
-            self._last_processed_ts = ts_ms
+    def _convert_color(self, frame, code):
+        # 前フレームと同じサイズなら同じバッファへ変換する（mp.Image は画素をコピーして保持する）
+        buf = self._color_buf
+        if buf is not None and buf.shape[:2] != frame.shape[:2]:
+            buf = None
+        buf = cv2.cvtColor(frame, code, dst=buf)
+        self._color_buf = buf
+        return buf
+
+    def _shrink_frame(self, frame):
+        limit = self._max_input_side
+        h, w = frame.shape[:2]
+        if limit <= 0 or max(h, w) <= limit:
+            return frame
+        # 縦横比は保つ（モデル側で入力サイズに合わせて変換される）
+        scale = limit / max(h, w)
+        size = (max(1, round(w * scale)), max(1, round(h * scale)))
+        buf = self._resize_buf
+        if buf is not None and buf.shape[:2] != (size[1], size[0]):
+            buf = None
+        buf = cv2.resize(frame, size, dst=buf, interpolation=cv2.INTER_AREA)
+        self._resize_buf = buf
+        return buf
+
+    def _consume_latest_result(self) -> Optional[Tuple[Optional[Gestures], int]]:
+        latest = self._latest_result  # 参照を一度だけ読む
+        if not latest:
+            return None
+        result, ts_ms = latest
+        if ts_ms == self._last_processed_ts:
+            return None
+        self._last_processed_ts = ts_ms
         return result, ts_ms
 
-    def _emit_event(self, out_queue: Queue, action: Action) -> None:
-        out_queue.put(InputEvent(action=action, note=self._event_note))
+    def _emit_event(self, out_queue: EventBuffer, action: Action) -> None:
+        out_queue.put(InputEvent(action=action, note=self._event_note, source=SOURCE_FACE))
 
-    def poll(self, px, out_queue: Queue) -> None:  # type: ignore[override]
+    def poll(self, px, out_queue: EventBuffer) -> None:  # type: ignore[override]
         # Backspaceキー
         if px is not None:
             try:
@@ -264,79 +447,75 @@ class FaceProvider:
         if payload is None:
             return
 
-        shapes, _ = payload
-        if shapes is None:
-            self._last_blink_active = False
-            self._last_mouth_active = False
-            self._last_smile_active = False
+        values, _ = payload
+        if values is None:
+            self._active_mask = 0
             return
 
-        blink = self._compute_blink(shapes)
-        mouth_open = self._compute_mouth_openness(shapes)
-        smile = self._compute_smile(shapes)
-
-        if blink is not None:
-            if not self._last_blink_active:
-                blink_active = blink >= self._blink_on
-            else:
-                blink_active = blink >= self._blink_off
-            if blink_active and not self._last_blink_active:
-                self._emit_event(out_queue, Action.ACTION1)
-            self._last_blink_active = blink_active
-
-        if mouth_open is not None:
-            if not self._last_mouth_active:
-                mouth_active = mouth_open >= self._mouth_on
-            else:
-                mouth_active = mouth_open >= self._mouth_off
-            if mouth_active and not self._last_mouth_active:
-                self._emit_event(out_queue, Action.ACTION2)
-            self._last_mouth_active = mouth_active
-
-        if smile is not None:
-            if not self._last_smile_active:
-                smile_active = smile >= self._smile_on
+        # 値が取れなかった動作は直前の状態のまま。ON 中は低い方の閾値で判定する
+        prev = self._active_mask
+        mask = prev
+        for (bit, on, off, _), value in zip(self._gestures, values):
+            if value is None:
+                continue
+            if value >= (off if prev & bit else on):
+                mask |= bit
             else:
-                smile_active = smile >= self._smile_off
-            if smile_active and not self._last_smile_active:
-                self._emit_event(out_queue, Action.ACTION3)
-            self._last_smile_active = smile_active
+                mask &= ~bit
+        self._active_mask = mask
+
+        # OFF から ON に変わった動作だけイベントを出す
+        rose = mask & ~prev
+        if rose:
+            for bit, _, _, action in self._gestures:
+                if rose & bit:
+                    self._emit_event(out_queue, action)
 
     def _on_async_result(self, result: Any, _output_image: Any, timestamp_ms: int) -> None:
-        # コールバック側でblendshape配列を辞書化して前処理
-        shapes: Optional[Dict[str, float]] = None
+        # コールバック側で必要なblendshape値だけを固定順のタプルに取り出し、
+        # 動作ごとの値まで求めておく（poll 側は閾値判定だけを行う）
+        values: Optional[Gestures] = None
         try:
             blends = getattr(result, "face_blendshapes", None)
             if blends and isinstance(blends, list) and len(blends) > 0:
                 items = blends[0]
                 if isinstance(items, list):
-                    tmp: Dict[str, float] = {}
-                    for c in items:
-                        cname = getattr(c, "category_name", None)
-                        score = getattr(c, "score", None)
-                        if cname and (score is not None):
-                            tmp[str(cname).lower()] = float(score)
-                    shapes = tmp
+                    index = self._blend_index
+                    if index is None or len(items) != self._blend_count:
+                        index = self._blend_index = self._build_blend_index(items)
+                        self._blend_count = len(items)
+                    scores = tuple(float(items[i].score) if i >= 0 else None for i in index)
+                    values = (
+                        self._compute_blink(scores),
+                        self._compute_mouth_openness(scores),
+                        self._compute_smile(scores),
+                    )
         except Exception:
-            shapes = None
+            values = None
         finally:
-            with self._result_lock:
-                self._latest_result = (shapes, timestamp_ms)
-
-    def _get_blendshape(self, shapes: Dict[str, float], name: str) -> Optional[float]:
-        return shapes.get(name.lower()) if shapes is not None else None
-
-    def _compute_blink(self, shapes: Dict[str, float]) -> Optional[float]:
+            self._empty_results = 0 if values is not None else self._empty_results + 1
+            self._latest_result = (values, timestamp_ms)
+
+    @staticmethod
+    def _build_blend_index(items: list) -> Tuple[int, ...]:
+        positions: Dict[str, int] = {}
+        for i, c in enumerate(items):
+            cname = getattr(c, "category_name", None)
+            if cname:
+                positions.setdefault(str(cname).lower(), i)
+        return tuple(positions.get(name, -1) for name in _BLENDSHAPE_NAMES)
+
+    def _compute_blink(self, scores: Scores) -> Optional[float]:
         # eyeBlink で判定
-        left_blink = self._get_blendshape(shapes, "eyeBlinkLeft")
-        right_blink = self._get_blendshape(shapes, "eyeBlinkRight")
+        left_blink = scores[_BLINK_L]
+        right_blink = scores[_BLINK_R]
         blink_avg = None
         if left_blink is not None and right_blink is not None:
             blink_avg = float((left_blink + right_blink) / 2.0)
 
         # eyeSquint でも判定
-        left_squint = self._get_blendshape(shapes, "eyeSquintLeft")
-        right_squint = self._get_blendshape(shapes, "eyeSquintRight")
+        left_squint = scores[_SQUINT_L]
+        right_squint = scores[_SQUINT_R]
         squint_avg = None
         if left_squint is not None and right_squint is not None:
             squint_avg = float((left_squint + right_squint) / 2.0)
@@ -349,27 +528,27 @@ class FaceProvider:
             return squint_avg
         return None
 
-    def _compute_mouth_openness(self, shapes: Dict[str, float]) -> Optional[float]:
+    def _compute_mouth_openness(self, scores: Scores) -> Optional[float]:
         # jawOpen or (1 - mouthClose) で判定
-        jo = self._get_blendshape(shapes, "jawOpen")
+        jo = scores[_JAW_OPEN]
         if jo is None:
-            mc = self._get_blendshape(shapes, "mouthClose")
+            mc = scores[_MOUTH_CLOSE]
             if mc is not None:
                 jo = float(1.0 - mc)
         if jo is not None:
             return float(jo)
         return None
 
-    def _compute_smile(self, shapes: Dict[str, float]) -> Optional[float]:
+    def _compute_smile(self, scores: Scores) -> Optional[float]:
         # mouthSmileLeft/Right を平均。両方無い場合は mouthCornerPullLeft/Right をフォールバック
-        l = self._get_blendshape(shapes, "mouthSmileLeft")
-        r = self._get_blendshape(shapes, "mouthSmileRight")
+        l = scores[_SMILE_L]
+        r = scores[_SMILE_R]
         val = None
         if l is not None and r is not None:
             val = float((l + r) / 2.0)
         if val is None:
-            l2 = self._get_blendshape(shapes, "mouthCornerPullLeft")
-            r2 = self._get_blendshape(shapes, "mouthCornerPullRight")
+            l2 = scores[_CORNER_PULL_L]
+            r2 = scores[_CORNER_PULL_R]
             if l2 is not None and r2 is not None:
                 val = float((l2 + r2) / 2.0)
         return val
@@ -1,8 +1,34 @@
 import cv2
 import mediapipe as mp
+import numpy as np
 import argparse
 import sys
 
+
+def draw_connections(image, face_landmarks, connections, drawing_spec):
+    """
+    mp_drawing.draw_landmarks と同じ線を描く。
+    線ごとに cv2.line を呼ぶ代わりに、色・太さが同じ線をまとめて cv2.polylines 一回で描く。
+    drawing_spec は DrawingSpec か、接続ごとの DrawingSpec の dict。
+    """
+    h, w = image.shape[:2]
+    pts = np.array([(lm.x, lm.y) for lm in face_landmarks.landmark], dtype=np.float64)
+    # 画像外の点に繋がる線は描かない（draw_landmarks と同じ）
+    inside = np.all((pts >= 0.0) & (pts <= 1.0), axis=1)
+    pixels = np.minimum(np.floor(pts * (w, h)), (w - 1, h - 1)).astype(np.int32)
+
+    groups = {}
+    for connection in connections:
+        spec = drawing_spec[connection] if isinstance(drawing_spec, dict) else drawing_spec
+        groups.setdefault((spec.color, spec.thickness), []).append(connection)
+    for (color, thickness), group in groups.items():
+        edges = np.array(group, dtype=np.intp)
+        edges = edges[inside[edges].all(axis=1)]
+        if len(edges):
+            # (線の数, 2点, xy) の配列をそのまま折れ線の集まりとして渡す
+            cv2.polylines(image, pixels[edges], False, color, thickness)
+
+
 def main():
     parser = argparse.ArgumentParser()
     parser.add_argument(
@@ -39,7 +65,6 @@ def main():
         sys.exit(1)
 
     mp_face_mesh = mp.solutions.face_mesh
-    mp_drawing = mp.solutions.drawing_utils
     mp_drawing_styles = mp.solutions.drawing_styles
 
     # 1枚だけフレームを取得して処理
@@ -70,22 +95,18 @@ def main():
         annotated = frame.copy()
 
         for face_landmarks in results.multi_face_landmarks:
-            mp_drawing.draw_landmarks(
-                image=annotated,
-                landmark_list=face_landmarks,
-                connections=mp_face_mesh.FACEMESH_TESSELATION,
-                landmark_drawing_spec=None,
-                connection_drawing_spec=mp_drawing_styles
-                .get_default_face_mesh_tesselation_style()
+            draw_connections(
+                annotated,
+                face_landmarks,
+                mp_face_mesh.FACEMESH_TESSELATION,
+                mp_drawing_styles.get_default_face_mesh_tesselation_style(),
             )
             # 輪郭なども描画したい場合は下を有効化
-            mp_drawing.draw_landmarks(
-                image=annotated,
-                landmark_list=face_landmarks,
-                connections=mp_face_mesh.FACEMESH_CONTOURS,
-                landmark_drawing_spec=None,
-                connection_drawing_spec=mp_drawing_styles
-                .get_default_face_mesh_contours_style()
+            draw_connections(
+                annotated,
+                face_landmarks,
+                mp_face_mesh.FACEMESH_CONTOURS,
+                mp_drawing_styles.get_default_face_mesh_contours_style(),
             )
 
         # 画像として保存
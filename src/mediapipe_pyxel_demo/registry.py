@@ -3,7 +3,7 @@ from __future__ import annotations
 import importlib
 import pkgutil
 from dataclasses import dataclass
-from typing import Any, Callable, Dict, Optional, Type
+from typing import Any, Callable, Dict, List, Optional, Tuple, Type
 
 
 @dataclass
@@ -15,18 +15,13 @@ class GameInfo:
 
 
 def _maybe_get_game_class(obj: Any) -> Optional[type]:
-    # 受け入れる形式: クラス本体 / GAME_CLASS 変数 / クラスを返すファクトリ
+    # 受け入れる形式: クラス本体 / GAME_CLASS 変数を持つオブジェクト（モジュール等）
+    # 判定のために関数を呼び出すことはしない（重い初期化が走るのを避ける）
     if isinstance(obj, type):
         return obj
-    if hasattr(obj, "GAME_CLASS") and isinstance(obj.GAME_CLASS, type):
-        return obj.GAME_CLASS
-    if callable(obj):
-        try:
-            v = obj()
-            if isinstance(v, type):
-                return v
-        except Exception:
-            return None
+    cls = getattr(obj, "GAME_CLASS", None)
+    if isinstance(cls, type):
+        return cls
     return None
 
 
@@ -52,22 +47,20 @@ def discover_local_games(base_pkg: str = "mediapipe_pyxel_demo.games") -> Dict[s
     return found
 
 
-def discover_entrypoint_games(group: str = "mediapipe_pyxel_demo.games") -> Dict[str, GameInfo]:
-    # エントリポイント経由で登録された外部パッケージのゲームを探索
+def _iter_entry_points(group: str) -> List[Any]:
     from importlib import metadata
 
-    found: Dict[str, GameInfo] = {}
     try:
-        # Python 3.10+ のエントリポイント API
-        entry_points = metadata.entry_points
-        try:
-            eps = entry_points(group=group)  # type: ignore[arg-type]
-        except TypeError:
-            eps = entry_points().get(group, [])  # type: ignore[index]
+        # requires-python >= 3.10 なので group 指定で該当グループだけを取得できる
+        return list(metadata.entry_points(group=group))
     except Exception:
-        return found
+        return []
 
-    for ep in eps:
+
+def discover_entrypoint_games(group: str = "mediapipe_pyxel_demo.games") -> Dict[str, GameInfo]:
+    # エントリポイント経由で登録された外部パッケージのゲームを探索
+    found: Dict[str, GameInfo] = {}
+    for ep in _iter_entry_points(group):
         try:
             obj = ep.load()
             cls = _maybe_get_game_class(obj)
@@ -78,10 +71,38 @@ def discover_entrypoint_games(group: str = "mediapipe_pyxel_demo.games") -> Dict
     return found
 
 
-def discover_games() -> Dict[str, GameInfo]:
+def list_game_names(
+    base_pkg: str = "mediapipe_pyxel_demo.games",
+    group: str = "mediapipe_pyxel_demo.games",
+) -> List[Tuple[str, str]]:
+    # ゲームモジュールをインポートせずに名前と由来だけを列挙（--list 用の軽量版）
+    names: Dict[str, str] = {}
+    try:
+        pkg = importlib.import_module(base_pkg)
+    except ImportError:
+        pkg = None
+    if pkg is not None:
+        for m in pkgutil.iter_modules(pkg.__path__):
+            if m.ispkg:
+                names[m.name] = "local"
+    for ep in _iter_entry_points(group):
+        dist = getattr(ep, "dist", None)
+        names[ep.name] = getattr(dist, "name", None) or ep.value
+    return sorted(names.items())
+
+
+_CACHED_GAMES: Optional[Dict[str, GameInfo]] = None
+
+
+def discover_games(force: bool = False) -> Dict[str, GameInfo]:
     # ローカル + エントリポイントの両方からゲームを集約
+    # 結果はプロセス内でキャッシュし、メニュー再表示時などの再スキャン/再インポートを避ける
+    global _CACHED_GAMES
+    if _CACHED_GAMES is not None and not force:
+        return _CACHED_GAMES
     games = {}
     games.update(discover_local_games())
     games.update(discover_entrypoint_games())
+    _CACHED_GAMES = games
     return games
 